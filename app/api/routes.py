@@ -7,8 +7,12 @@ All FastAPI endpoint handlers for CloudPulse.
 import logging
 import uuid
 from datetime import date, timedelta
+from typing import Iterator
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -288,7 +292,8 @@ async def get_forecast(
     try:
         from app.services.local_cost_explorer import LocalCostExplorerService
         ce = LocalCostExplorerService()
-        aws_forecast = ce.get_cost_forecast(
+        aws_forecast = await run_in_threadpool(
+            ce.get_cost_forecast,
             start_date=today + timedelta(days=1),
             end_date=month_end,
         )
@@ -302,7 +307,7 @@ async def get_forecast(
                 daily_avg=daily_avg,
                 days_remaining=days_remaining,
                 projected_total=projected_total,
-                source="aws",
+                source="linear" if aws_forecast.get("projected") else "aws",
             )
     except Exception as e:
         logger.warning(f"AWS forecast unavailable, using linear: {e}")
@@ -657,7 +662,8 @@ async def get_available_tags(
 
     today = date.today()
     ce = LocalCostExplorerService()
-    tags = ce.get_available_tags(
+    tags = await run_in_threadpool(
+        ce.get_available_tags,
         start_date=today - timedelta(days=30),
         end_date=today,
     )
@@ -684,7 +690,8 @@ async def get_costs_by_tag(
     ce = LocalCostExplorerService()
 
     try:
-        tag_costs = ce.get_cost_by_tag(
+        tag_costs = await run_in_threadpool(
+            ce.get_cost_by_tag,
             start_date=today - timedelta(days=days),
             end_date=today,
             tag_key=tag_key,
@@ -716,6 +723,38 @@ async def get_costs_by_tag(
     }
 
 
+def generate_ndjson(rows: Iterator[dict]) -> Iterator[bytes]:
+    """Serialise rows as newline-delimited JSON, one line per row."""
+    for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+
+@router.get("/accounts/{account_id}/costs/by-service/stream")
+async def stream_costs_by_service(
+    account_id: str,
+    days: int = 30,
+    granularity: str = "DAILY",
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream per-service costs straight from Cost Explorer as NDJSON."""
+    from app.services.local_cost_explorer import LocalCostExplorerService
+
+    result = await db.execute(
+        select(AWSAccount).where(AWSAccount.id == account_id)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(status_code=404, detail="Account not found")
+
+    today = date.today()
+    ce = LocalCostExplorerService()
+    rows = ce.iter_cost_by_service(
+        start_date=today - timedelta(days=days),
+        end_date=today,
+        granularity=granularity,
+    )
+    return StreamingResponse(generate_ndjson(rows), media_type="application/x-ndjson")
+
+
 # -------------------------------------------------------------------
 # One-Click CloudFormation Setup (P1)
 # -------------------------------------------------------------------
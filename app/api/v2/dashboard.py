@@ -66,10 +66,10 @@ async def get_dashboard_summary(db: AsyncSession = Depends(get_db)):
 
     providers = []
     for key, accts in provider_map.items():
-        info = get_provider(key) or {}
+        info = get_provider(key)
         providers.append(ProviderSummary(
             provider=key,
-            display_name=info.get("display_name", key),
+            display_name=info.display_name if info else key,
             count=len(accts),
             status="active" if any(a.status == AccountSyncStatus.ACTIVE for a in accts) else "error",
         ))
@@ -6,6 +6,7 @@ connection management, and cost data synchronization for all 28 providers.
 
 Endpoints:
     GET    /api/v2/integrations/catalog      - Provider catalog (drives frontend)
+    GET    /api/v2/integrations/catalog/{key} - Single provider catalog entry
     GET    /api/v2/integrations              - List active integrations
     POST   /api/v2/integrations/connect      - Connect a new provider
     POST   /api/v2/integrations/{id}/validate - Test credentials
@@ -17,7 +18,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,7 +26,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.models.providers import CloudAccount, CloudProvider, AccountSyncStatus
 from app.services.provider_registry import (
-    get_catalog_grouped, get_provider, PROVIDER_CATALOG,
+    get_catalog_etag, get_catalog_grouped_json, get_provider,
+    get_provider_etag, get_provider_json,
 )
 from app.services.connectors import get_connector
 from app.api.v2.webhooks import dispatch_event
@@ -69,11 +71,13 @@ class ValidateResponse(BaseModel):
 # ── Helpers ───────────────────────────────────────────────────────
 
 def _to_response(account: CloudAccount) -> IntegrationResponse:
-    provider_info = get_provider(account.provider.value) or {}
+    provider_info = get_provider(account.provider.value)
     return IntegrationResponse(
         id=str(account.id),
         provider=account.provider.value,
-        provider_display_name=provider_info.get("display_name", account.provider.value),
+        provider_display_name=(
+            provider_info.display_name if provider_info else account.provider.value
+        ),
         display_name=account.display_name,
         status=account.status.value,
         last_sync_at=account.last_sync_at.isoformat() if account.last_sync_at else None,
@@ -86,13 +90,35 @@ def _to_response(account: CloudAccount) -> IntegrationResponse:
 # ── Endpoints ─────────────────────────────────────────────────────
 
 @router.get("/catalog")
-async def get_integration_catalog():
+async def get_integration_catalog(request: Request):
     """
     Return the full provider catalog grouped by category.
 
     The frontend renders the entire Integrations page from this response.
+    The payload is static, so clients revalidate with If-None-Match and get
+    a 304 when their copy is current.
     """
-    return {"categories": get_catalog_grouped()}
+    etag = get_catalog_etag()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=get_catalog_grouped_json(), media_type="application/json", headers=headers,
+    )
+
+
+@router.get("/catalog/{provider_key}")
+async def get_integration_catalog_entry(provider_key: str, request: Request):
+    """Return a single provider's catalog entry, with ETag revalidation."""
+    etag = get_provider_etag(provider_key)
+    if etag is None:
+        raise HTTPException(status_code=404, detail=f"Unknown provider: {provider_key}")
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=get_provider_json(provider_key), media_type="application/json", headers=headers,
+    )
 
 
 @router.get("", response_model=list[IntegrationResponse])
@@ -128,8 +154,8 @@ async def connect_integration(
     if not provider_info:
         raise HTTPException(status_code=400, detail=f"Unknown provider: {payload.provider}")
 
-    if provider_info.get("status") == "coming_soon":
-        raise HTTPException(status_code=400, detail=f"{provider_info['display_name']} is coming soon.")
+    if provider_info.status == "coming_soon":
+        raise HTTPException(status_code=400, detail=f"{provider_info.display_name} is coming soon.")
 
     # Validate provider enum
     try:
@@ -154,7 +180,7 @@ async def connect_integration(
     account = CloudAccount(
         provider=provider_enum,
         account_identifier=validation.account_identifier or payload.provider,
-        display_name=payload.display_name or provider_info["display_name"],
+        display_name=payload.display_name or provider_info.display_name,
         connection_config=payload.credentials,
         status=AccountSyncStatus.ACTIVE,
     )
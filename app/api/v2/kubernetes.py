@@ -9,8 +9,10 @@ Endpoints:
 """
 
 import logging
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional
 
 from app.services.kubernetes_costs import get_kubernetes_cost_service
@@ -29,13 +31,33 @@ class MetricsPayload(BaseModel):
     namespaces: list[dict] = Field(default_factory=list)
 
 
-@router.post("/metrics")
-async def push_metrics(cluster_id: str, payload: MetricsPayload):
+@router.post(
+    "/metrics",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": MetricsPayload.model_json_schema()}},
+            "required": True,
+        },
+    },
+)
+async def push_metrics(cluster_id: str, request: Request):
     """
     Receive metrics from the CloudPulse K8s agent.
 
     The agent running in each cluster pushes node/pod metrics every 5 minutes.
+    Payloads can be large (every pod with labels), so the body is parsed
+    with orjson before validation.
     """
+    try:
+        payload = MetricsPayload.model_validate(orjson.loads(await request.body()))
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    except ValidationError as e:
+        # Same error shape FastAPI produces for a declared body parameter
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
     svc = get_kubernetes_cost_service()
     result = svc.ingest_metrics(cluster_id, payload.model_dump())
     return result
@@ -63,10 +85,10 @@ async def get_namespace_costs(cluster_id: str):
 
 
 @router.get("/clusters/{cluster_id}/rightsizing")
-async def get_rightsizing(cluster_id: str):
-    """Get rightsizing recommendations for a cluster."""
+async def get_rightsizing(cluster_id: str, limit: Optional[int] = None):
+    """Get rightsizing recommendations for a cluster (top ``limit`` by savings, if set)."""
     svc = get_kubernetes_cost_service()
-    recs = svc.get_rightsizing_recommendations(cluster_id)
+    recs = svc.get_rightsizing_recommendations(cluster_id, limit=limit)
     total_savings = sum(r["estimated_monthly_savings"] for r in recs)
     return {
         "cluster_id": cluster_id,
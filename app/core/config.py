@@ -41,6 +41,10 @@ class Settings(BaseSettings):
     duckdb_path: str = "data/cloudpulse.duckdb"
     billing_data_dir: str = "data/billing"
 
+    # Cost Explorer response cache
+    ce_cache_path: str = "data/ce_cache.sqlite"
+    ce_cache_mode: str = "enabled"  # enabled | read_only | replay | disabled
+
     # CUR Ingestion
     cur_s3_bucket: str = ""
     cur_s3_prefix: str = "cur/"
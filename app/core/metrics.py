@@ -0,0 +1,42 @@
+"""
+Prometheus Metrics
+
+Process-wide counters and gauges for CloudPulse's caches and Cost Explorer
+calls, exposed at /metrics. Hit rates here are what drive cache sizing and
+TTL tuning.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# --- Cost Explorer response cache ---
+CE_CACHE_HITS = Counter(
+    "cloudpulse_ce_cache_hits_total",
+    "Cost Explorer responses served from the local cache.",
+    ["method"],
+)
+CE_CACHE_MISSES = Counter(
+    "cloudpulse_ce_cache_misses_total",
+    "Cost Explorer lookups not found in the local cache.",
+    ["method"],
+)
+
+# --- Cost Explorer API calls ---
+CE_REQUEST_DURATION = Histogram(
+    "cloudpulse_ce_request_duration_seconds",
+    "Latency of individual Cost Explorer API calls.",
+    ["operation"],
+)
+
+# --- Kubernetes agent metrics store ---
+K8S_METRICS_CACHE_HITS = Counter(
+    "cloudpulse_k8s_metrics_cache_hits_total",
+    "Cluster metrics lookups that found a live snapshot.",
+)
+K8S_METRICS_CACHE_MISSES = Counter(
+    "cloudpulse_k8s_metrics_cache_misses_total",
+    "Cluster metrics lookups for unknown or expired clusters.",
+)
+K8S_METRICS_CACHE_SIZE = Gauge(
+    "cloudpulse_k8s_metrics_cache_entries",
+    "Live cluster snapshots held in the metrics store.",
+)
@@ -8,7 +8,9 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from prometheus_client import make_asgi_app
 
 from app.api.routes import router
 from app.api.v2 import v2_router
@@ -35,6 +37,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -49,6 +52,9 @@ app.add_middleware(
 # Serve static files (CloudFormation templates, etc.)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Prometheus metrics (cache hit rates, Cost Explorer latency)
+app.mount("/metrics", make_asgi_app())
+
 # Include API routes
 app.include_router(router, prefix="/api/v1")
 app.include_router(v2_router, prefix="/api/v2")
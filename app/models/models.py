@@ -3,7 +3,8 @@ from datetime import datetime, date
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
-    Column, String, Float, DateTime, Date, ForeignKey, Text, Enum, Boolean, Index
+    Column, String, Float, DateTime, Date, ForeignKey, Text, Enum, Boolean, Index,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -114,6 +115,8 @@ class CostRecord(Base):
     __table_args__ = (
         Index("ix_cost_records_account_date", "aws_account_id", "date"),
         Index("ix_cost_records_date_service", "date", "service"),
+        # One row per account/day/service; conflict target for sync upserts
+        UniqueConstraint("aws_account_id", "date", "service", name="uq_cost_records_account_date_service"),
     )
 
 
@@ -136,6 +139,7 @@ class Anomaly(Base):
 
     __table_args__ = (
         Index("ix_anomalies_account_date", "aws_account_id", "date"),
+        UniqueConstraint("aws_account_id", "date", "service", name="uq_anomalies_account_date_service"),
     )
 
 
@@ -0,0 +1,108 @@
+"""
+AWS Request Batcher
+
+Scans started close together (the digest job plus API-triggered scans)
+tend to issue the exact same describe calls against the same account and
+region. This module coalesces them: the first caller for a key fetches
+immediately, and every identical request arriving while that call is in
+flight waits for it and receives the same response. A caller with no
+call in flight never waits.
+
+Keys are (AWS account id, region, API, parameters), so different accounts
+never share results while separate engines/sessions for one account do.
+Results are shared between callers and must be treated as read-only.
+
+Usage:
+    instances = batched_describe_instances(account_id, ec2, filters)
+"""
+
+import logging
+import threading
+from itertools import chain
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# EC2 DescribeInstances MaxResults ceiling
+DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+
+
+class _Batch:
+    """One in-flight request and the outcome shared by everyone who joined it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestBatcher:
+    """Thread-safe coalescing of identical calls that overlap in time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, _Batch] = {}
+
+    def call(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return fetch()'s result, sharing one call among concurrent callers of key."""
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = _Batch()
+
+        if not leader:
+            batch.done.wait()
+        else:
+            try:
+                batch.result = fetch()
+            except BaseException as e:
+                batch.error = e
+            finally:
+                with self._lock:
+                    del self._pending[key]
+                batch.done.set()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.result
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of a boto3 parameter structure (dicts/lists of scalars)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+_batcher = RequestBatcher()
+
+
+def get_request_batcher() -> RequestBatcher:
+    return _batcher
+
+
+def batched_describe_instances(
+    account_id: str,
+    ec2,
+    filters: list[dict],
+) -> list[dict]:
+    """
+    All instances matching filters in the client's region, read through the
+    describe_instances paginator. Identical requests for the same account
+    and region made while one is in flight share its paginated call.
+    """
+    def fetch() -> list[dict]:
+        pages = ec2.get_paginator("describe_instances").paginate(
+            Filters=filters,
+            PaginationConfig={"PageSize": DESCRIBE_INSTANCES_PAGE_SIZE},
+        )
+        reservations = chain.from_iterable(page.get("Reservations", []) for page in pages)
+        return list(chain.from_iterable(r.get("Instances", []) for r in reservations))
+
+    key = (account_id, ec2.meta.region_name, "describe_instances", _freeze(filters))
+    return _batcher.call(key, fetch)
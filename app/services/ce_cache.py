@@ -0,0 +1,171 @@
+"""
+Cost Explorer Response Cache
+
+Every Cost Explorer request costs $0.01 and takes about a second, but cost
+data for a window that closed more than ~48 hours ago no longer changes.
+This module caches parsed responses in a local SQLite file, keyed by a
+SHA-256 over the AWS account, the method name and its arguments.
+
+Cache modes (settings.ce_cache_mode / CE_CACHE_MODE):
+    enabled    - serve hits, store misses (default)
+    read_only  - serve hits, never write
+    replay     - serve hits, raise CacheMissError on a miss (reproducible runs)
+    disabled   - always call Cost Explorer
+
+Usage:
+    class LocalCostExplorerService:
+        @ce_cache()
+        def get_total_cost(self, start_date, end_date, granularity="DAILY"): ...
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.core.config import get_settings
+from app.core.metrics import CE_CACHE_HITS, CE_CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+# Windows that ended at least this long ago (48h) are treated as immutable.
+SETTLED_AFTER = timedelta(days=2)
+
+# TTL for windows that still include recent (unsettled) days.
+RECENT_TTL_SECONDS = 15 * 60
+
+CACHE_MODES = ("enabled", "read_only", "replay", "disabled")
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay mode when a query has no cached response."""
+
+
+class CostExplorerCache:
+    """Thread-safe SQLite key/value store for Cost Explorer responses."""
+
+    def __init__(self, path: str, mode: str = "enabled"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid CE cache mode {mode!r}; expected one of {CACHE_MODES}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy connection — created on first access."""
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ce_cache ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " expires_at REAL"  # NULL = never expires
+                ")"
+            )
+            # Recent-window entries are rewritten under new keys every day
+            self._conn.execute("DELETE FROM ce_cache WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (hit, value) for a key, deleting it if it has expired."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload, expires_at FROM ce_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            payload, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self.conn.execute("DELETE FROM ce_cache WHERE key = ?", (key,))
+                self.conn.commit()
+                return False, None
+        return True, json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store a value; ``ttl=None`` keeps it forever."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ce_cache (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            self.conn.commit()
+
+
+def cache_key(account_id: str, method: str, *parts: Any) -> str:
+    """Deterministic key over the account, a method name and its (stringified) arguments."""
+    raw = "|".join([account_id, method, *(str(p) for p in parts)])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def ttl_for_window(end_date: date, today: Optional[date] = None) -> Optional[float]:
+    """Settled windows are cached forever; windows touching recent days expire."""
+    today = today or date.today()
+    if end_date <= today - SETTLED_AFTER:
+        return None
+    return RECENT_TTL_SECONDS
+
+
+def ce_cache() -> Callable:
+    """
+    Decorate a Cost Explorer method taking ``(self, start_date, end_date, ...)``.
+
+    The key covers ``self.account_id``, the method name and every bound
+    argument (defaults included), so switching credentials never serves
+    another account's data and ``granularity``/``tag_key`` variations are
+    cached separately.
+    """
+    def decorator(fn: Callable) -> Callable:
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            cache = get_ce_cache()
+            if cache.mode == "disabled":
+                return fn(self, *args, **kwargs)
+
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+            key = cache_key(self.account_id, fn.__name__, *arguments.values())
+
+            hit, value = cache.get(key)
+            if hit:
+                CE_CACHE_HITS.labels(fn.__name__).inc()
+                return value
+            CE_CACHE_MISSES.labels(fn.__name__).inc()
+            if cache.mode == "replay":
+                raise CacheMissError(f"No cached response for {fn.__name__}{tuple(arguments.values())}")
+
+            value = fn(self, *args, **kwargs)
+            if cache.mode == "enabled":
+                cache.set(key, value, ttl_for_window(arguments["end_date"]))
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# Module-level singleton for reuse across requests
+_cache: Optional[CostExplorerCache] = None
+
+
+def get_ce_cache() -> CostExplorerCache:
+    """Get or create the singleton Cost Explorer cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = CostExplorerCache(settings.ce_cache_path, settings.ce_cache_mode)
+    return _cache
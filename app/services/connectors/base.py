@@ -153,9 +153,11 @@ class BaseConnector(ABC):
     ) -> str:
         """Write FOCUS records to a Parquet file."""
         import pyarrow as pa
+        import pyarrow.compute as pc
         import pyarrow.parquet as pq
 
         from app.core.config import get_settings
+        from app.services.focus_schema import AMOUNT_TYPE
 
         settings = get_settings()
         base_dir = Path(output_dir or settings.billing_data_dir) / self.provider_key
@@ -166,7 +168,10 @@ class BaseConnector(ABC):
             "provider": [r.provider for r in records],
             "service": [r.service for r in records],
             "usage_date": [r.usage_date for r in records],
-            "amount": [r.amount for r in records],
+            # Same DECIMAL(18,6) as the FOCUS files DuckDB reads alongside these
+            "amount": pc.cast(
+                pa.array([r.amount for r in records], pa.float64()), AMOUNT_TYPE, safe=False
+            ),
             "currency": [r.currency for r in records],
             "region": [r.region for r in records],
             "account_id": [r.account_id for r in records],
@@ -22,10 +22,11 @@ from pathlib import Path
 from typing import Optional
 
 import boto3
+import duckdb
 from botocore.exceptions import ClientError
 
 from app.core.config import get_settings
-from app.services.focus_schema import normalize_aws_cur, write_focus_parquet
+from app.services.focus_schema import aws_cur_focus_sql, normalize_aws_cur, write_focus_parquet
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -250,8 +251,11 @@ class CURIngestor:
         """
         Ingest CUR data from a local CSV file (for development/testing).
 
+        The CSV is read and normalized to FOCUS entirely inside DuckDB and
+        streamed straight to Parquet, so rows never pass through Python.
+
         Args:
-            csv_path: Path to a local CUR CSV file.
+            csv_path: Path to a local CUR CSV file (optionally gzipped).
 
         Returns:
             Number of rows ingested.
@@ -261,24 +265,26 @@ class CURIngestor:
             logger.error(f"File not found: {csv_path}")
             return 0
 
-        if path.suffix == ".gz":
-            with gzip.open(path, "rt") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-        else:
-            with open(path, "r") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-        logger.info(f"Read {len(rows)} rows from {csv_path}")
-
-        normalized = normalize_aws_cur(rows)
-        if not normalized:
-            return 0
-
         self.output_dir.mkdir(parents=True, exist_ok=True)
         stem = path.stem.replace(".csv", "")
-        output_path = str(self.output_dir / f"cur_{stem}.parquet")
-        write_focus_parquet(normalized, output_path)
+        output_path = self.output_dir / f"cur_{stem}.parquet"
 
-        return len(normalized)
+        src = str(path).replace("'", "''")
+        dest = str(output_path).replace("'", "''")
+        source = f"read_csv_auto('{src}', header=true, all_varchar=true)"
+        conn = duckdb.connect()
+        try:
+            columns = {row[0] for row in conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()}
+            sql = aws_cur_focus_sql(source, columns)
+            count = conn.execute(
+                f"COPY ({sql}) TO '{dest}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+        if not count:
+            output_path.unlink(missing_ok=True)
+            return 0
+
+        logger.info(f"Wrote {count} FOCUS rows from {csv_path} to {output_path}")
+        return count
@@ -13,6 +13,7 @@ Usage:
 
 import logging
 from datetime import date
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
@@ -189,9 +190,12 @@ class DuckDBEngine:
             FROM {view}
             WHERE {where_sql}
             GROUP BY period, currency
-            ORDER BY period
         """
-        return self.query(sql, params)
+        # At most a few hundred periods come back, so sort here instead of
+        # making DuckDB buffer the aggregate for an ORDER BY.
+        results = self.query(sql, params)
+        results.sort(key=itemgetter("period"))
+        return results
 
     def get_cost_by_region(
         self,
@@ -281,9 +285,10 @@ class DuckDBEngine:
             FROM {view}
             WHERE {where_sql}
             GROUP BY period, {group_by}, currency
-            ORDER BY period, total_amount DESC
         """
-        return self.query(sql, params)
+        results = self.query(sql, params)
+        results.sort(key=lambda r: (r["period"], -r["total_amount"]))
+        return results
 
     def get_table_stats(self) -> dict:
         """Get stats about loaded billing data."""
@@ -0,0 +1,39 @@
+"""
+FOCUS Normalization Kernels
+
+Numeric kernels used by the FOCUS normalizers once a billing column has
+been lifted into a NumPy array.
+
+Numba is optional: when it is installed the kernels are JIT-compiled into a
+single parallel pass; otherwise they fall back to the equivalent vectorized
+NumPy expression.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Rows whose absolute cost is below this are dropped as rounding noise.
+AMOUNT_EPSILON = 1e-4
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def mask_amounts(amounts: np.ndarray, eps: float = AMOUNT_EPSILON) -> np.ndarray:
+        """Boolean mask of rows whose |amount| is at least ``eps``."""
+        out = np.empty(amounts.shape[0], dtype=np.bool_)
+        for i in prange(amounts.shape[0]):
+            out[i] = abs(amounts[i]) >= eps
+        return out
+
+else:
+
+    def mask_amounts(amounts: np.ndarray, eps: float = AMOUNT_EPSILON) -> np.ndarray:
+        """Boolean mask of rows whose |amount| is at least ``eps``."""
+        return np.abs(amounts) >= eps
@@ -15,7 +15,7 @@ Unified columns:
     resource_id     - Resource ARN/ID
     usage_date      - Date of usage (DATE type)
     charge_type     - 'Usage', 'Tax', 'Credit', 'Refund', 'Support', etc.
-    amount          - Cost amount (DOUBLE)
+    amount          - Cost amount (DECIMAL(18,6))
     currency        - Currency code (e.g., 'USD')
     tags            - JSON object of resource tags
 """
@@ -23,14 +23,23 @@ Unified columns:
 import logging
 from typing import Optional
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from app.services.focus_numba import mask_amounts
+
 logger = logging.getLogger(__name__)
 
 
 # --- FOCUS output schema ---
 
+# Billing amounts are stored as fixed-point DECIMAL(18,6) rather than DOUBLE:
+# DuckDB sums decimals on the underlying integers, so aggregates are exact
+# and don't drift with float summation order.
+AMOUNT_TYPE = pa.decimal128(18, 6)
+
 FOCUS_SCHEMA = pa.schema([
     pa.field("provider", pa.string(), nullable=False),
     pa.field("account_id", pa.string(), nullable=False),
@@ -39,7 +48,7 @@ FOCUS_SCHEMA = pa.schema([
     pa.field("resource_id", pa.string(), nullable=True),
     pa.field("usage_date", pa.date32(), nullable=False),
     pa.field("charge_type", pa.string(), nullable=True),
-    pa.field("amount", pa.float64(), nullable=False),
+    pa.field("amount", AMOUNT_TYPE, nullable=False),
     pa.field("currency", pa.string(), nullable=False),
     pa.field("tags", pa.string(), nullable=True),  # JSON string
 ])
@@ -146,6 +155,86 @@ AZURE_CHARGE_TYPE_MAP = {
 }
 
 
+# --- AWS CUR → FOCUS in SQL ---
+
+AWS_CUR_TAG_PREFIX = "resourceTags/user:"
+
+
+def _sql_str(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_case(column: str, mapping: dict[str, str], default: str) -> str:
+    whens = " ".join(f"WHEN {_sql_str(k)} THEN {_sql_str(v)}" for k, v in mapping.items())
+    return f"CASE {column} {whens} ELSE {default} END"
+
+
+def aws_cur_focus_sql(source: str, columns: set[str]) -> str:
+    """
+    Build a DuckDB SELECT that applies the same transform as normalize_aws_cur.
+
+    Args:
+        source: A DuckDB table expression over raw CUR rows, read as VARCHAR
+            (e.g. ``read_csv_auto('cur.csv.gz', all_varchar=true)``).
+        columns: Column names present in the source; missing CUR columns
+            fall back to the same defaults the Python normalizer uses.
+
+    Returns:
+        SQL producing rows in FOCUS_SCHEMA column order.
+    """
+    def col(name: str, default: str = "''") -> str:
+        if name in columns:
+            return f"COALESCE({_sql_ident(name)}, {default})"
+        return default
+
+    product_code = col("lineItem/ProductCode", "'Unknown'")
+    tag_columns = sorted(c for c in columns if c.startswith(AWS_CUR_TAG_PREFIX))
+    if tag_columns:
+        entries = ", ".join(
+            f"{{'k': {_sql_str(c[len(AWS_CUR_TAG_PREFIX):])}, 'v': {_sql_ident(c)}}}"
+            for c in tag_columns
+        )
+        tags_expr = (
+            f"NULLIF(CAST(to_json(map_from_entries(list_filter([{entries}], "
+            f"t -> COALESCE(t.v, '') <> ''))) AS VARCHAR), '{{}}')"
+        )
+    else:
+        tags_expr = "CAST(NULL AS VARCHAR)"
+
+    return f"""
+        SELECT
+            'aws' AS provider,
+            {col("lineItem/UsageAccountId")} AS account_id,
+            {_sql_case(product_code, AWS_SERVICE_NAME_MAP, product_code)} AS service,
+            {col("product/region")} AS region,
+            {col("lineItem/ResourceId")} AS resource_id,
+            CAST(LEFT(usage_start, 10) AS DATE) AS usage_date,
+            {_sql_case(col("lineItem/LineItemType", "'Usage'"), AWS_CHARGE_TYPE_MAP, "'Usage'")} AS charge_type,
+            CAST(ROUND(cost, 6) AS DECIMAL(18, 6)) AS amount,
+            {col("lineItem/CurrencyCode", "'USD'")} AS currency,
+            {tags_expr} AS tags
+        FROM (
+            SELECT
+                *,
+                COALESCE(TRY_CAST({col("lineItem/UnblendedCost", "'0'")} AS DOUBLE), 0) AS cost,
+                {col("lineItem/UsageStartDate")} AS usage_start
+            FROM {source}
+        )
+        WHERE ABS(cost) >= 0.0001 AND usage_start <> ''
+    """
+
+
+def _parse_amount(raw) -> float:
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return 0.0
+
+
 def normalize_aws_cur(rows: list[dict]) -> list[dict]:
     """
     Normalize AWS CUR rows to FOCUS schema.
@@ -156,27 +245,34 @@ def normalize_aws_cur(rows: list[dict]) -> list[dict]:
     Returns:
         List of FOCUS-normalized dicts ready for Parquet writing.
     """
+    import json
+
+    # Parse the cost column once into an array and drop negligible rows in a
+    # single vectorized pass before doing any per-row dict work.
+    amounts = np.fromiter(
+        (_parse_amount(row.get("lineItem/UnblendedCost", "0")) for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+    keep = np.flatnonzero(mask_amounts(amounts))
+
     normalized = []
-    for row in rows:
-        amount_raw = row.get("lineItem/UnblendedCost", "0")
-        try:
-            amount = float(amount_raw)
-        except (ValueError, TypeError):
-            amount = 0.0
+    for i in keep:
+        row = rows[i]
 
-        if abs(amount) < 0.0001:
-            continue
+        # Blank CUR cells fall back to the same defaults as aws_cur_focus_sql,
+        # where DuckDB reads them as NULL.
 
         # Normalize charge type
-        raw_charge_type = row.get("lineItem/LineItemType", "Usage")
+        raw_charge_type = row.get("lineItem/LineItemType") or "Usage"
         charge_type = AWS_CHARGE_TYPE_MAP.get(raw_charge_type, "Usage")
 
         # Normalize service name
-        raw_service = row.get("lineItem/ProductCode", "Unknown")
+        raw_service = row.get("lineItem/ProductCode") or "Unknown"
         service = AWS_SERVICE_NAME_MAP.get(raw_service, raw_service)
 
         # Extract usage date (CUR provides full timestamp)
-        usage_date_raw = row.get("lineItem/UsageStartDate", "")
+        usage_date_raw = row.get("lineItem/UsageStartDate") or ""
         usage_date = usage_date_raw[:10] if usage_date_raw else None
         if not usage_date:
             continue
@@ -188,17 +284,16 @@ def normalize_aws_cur(rows: list[dict]) -> list[dict]:
                 tag_key = key.replace("resourceTags/user:", "")
                 tags[tag_key] = value
 
-        import json
         normalized.append({
             "provider": "aws",
-            "account_id": row.get("lineItem/UsageAccountId", ""),
+            "account_id": row.get("lineItem/UsageAccountId") or "",
             "service": service,
-            "region": row.get("product/region", ""),
-            "resource_id": row.get("lineItem/ResourceId", ""),
+            "region": row.get("product/region") or "",
+            "resource_id": row.get("lineItem/ResourceId") or "",
             "usage_date": usage_date,
             "charge_type": charge_type,
-            "amount": round(amount, 6),
-            "currency": row.get("lineItem/CurrencyCode", "USD"),
+            "amount": round(float(amounts[i]), 6),
+            "currency": row.get("lineItem/CurrencyCode") or "USD",
             "tags": json.dumps(tags) if tags else None,
         })
 
@@ -339,58 +434,40 @@ def write_focus_parquet(rows: list[dict], output_path: str):
         rows: List of FOCUS-schema dicts.
         output_path: Path to write the .parquet file.
     """
-    import json
     from datetime import date as date_type
 
     if not rows:
         logger.warning("No rows to write — skipping Parquet output")
         return
 
-    # Build columnar arrays
-    providers = []
-    account_ids = []
-    services = []
-    regions = []
-    resource_ids = []
-    usage_dates = []
-    charge_types = []
-    amounts = []
-    currencies = []
-    tags_col = []
+    n = len(rows)
 
-    for row in rows:
-        providers.append(row["provider"])
-        account_ids.append(row["account_id"])
-        services.append(row["service"])
-        regions.append(row.get("region"))
-        resource_ids.append(row.get("resource_id"))
-
-        # Parse date
-        ud = row["usage_date"]
-        if isinstance(ud, str):
-            from datetime import datetime
-            ud = datetime.strptime(ud, "%Y-%m-%d").date()
-        usage_dates.append(ud)
-
-        charge_types.append(row.get("charge_type"))
-        amounts.append(float(row["amount"]))
-        currencies.append(row["currency"])
-        tags_col.append(row.get("tags"))
+    def _string_column(name: str, required: bool = False) -> pa.Array:
+        # pa.array consumes the generator directly into Arrow's builder,
+        # so no intermediate Python list is materialized per column.
+        values = (r[name] for r in rows) if required else (r.get(name) for r in rows)
+        return pa.array(values, type=pa.string(), size=n)
+
+    def _parse_date(ud):
+        return date_type.fromisoformat(ud) if isinstance(ud, str) else ud
+
+    # Numeric column is filled into a single preallocated float64 buffer.
+    amounts = np.fromiter((r["amount"] for r in rows), dtype=np.float64, count=n)
 
     table = pa.table({
-        "provider": pa.array(providers, type=pa.string()),
-        "account_id": pa.array(account_ids, type=pa.string()),
-        "service": pa.array(services, type=pa.string()),
-        "region": pa.array(regions, type=pa.string()),
-        "resource_id": pa.array(resource_ids, type=pa.string()),
-        "usage_date": pa.array(usage_dates, type=pa.date32()),
-        "charge_type": pa.array(charge_types, type=pa.string()),
-        "amount": pa.array(amounts, type=pa.float64()),
-        "currency": pa.array(currencies, type=pa.string()),
-        "tags": pa.array(tags_col, type=pa.string()),
+        "provider": _string_column("provider", required=True),
+        "account_id": _string_column("account_id", required=True),
+        "service": _string_column("service", required=True),
+        "region": _string_column("region"),
+        "resource_id": _string_column("resource_id"),
+        "usage_date": pa.array((_parse_date(r["usage_date"]) for r in rows), type=pa.date32(), size=n),
+        "charge_type": _string_column("charge_type"),
+        "amount": pc.cast(pa.array(amounts, type=pa.float64()), AMOUNT_TYPE, safe=False),
+        "currency": _string_column("currency", required=True),
+        "tags": _string_column("tags"),
     })
 
     from pathlib import Path
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     pq.write_table(table, output_path, compression="snappy")
-    logger.info(f"Wrote {len(rows)} FOCUS rows to {output_path}")
+    logger.info(f"Wrote {n} FOCUS rows to {output_path}")
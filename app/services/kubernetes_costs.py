@@ -15,10 +15,22 @@ Metrics are pushed by the CloudPulse K8s agent running in each cluster.
 """
 
 import logging
+import sys
+import threading
+from collections import Counter
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
+import numpy as np
+from cachetools import TTLCache
+
 from app.core.database import Base
+from app.core.metrics import (
+    K8S_METRICS_CACHE_HITS, K8S_METRICS_CACHE_MISSES, K8S_METRICS_CACHE_SIZE,
+)
+from app.services.kubernetes_numba import aggregate_by_ns
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +39,174 @@ logger = logging.getLogger(__name__)
 # In production, this would be stored in the database.
 # For now, the agent pushes metrics and we store them in memory.
 
-_cluster_metrics: dict[str, dict] = {}
+
+class _ClusterMetricsStore:
+    """
+    Bounded, expiring store of the latest metrics snapshot per cluster.
+
+    Entries live in TTLCaches so clusters whose agent stops pushing are
+    evicted, and the store can't grow without bound. Keys are spread over
+    a few shards, each with its own lock, so agent pushes and API reads
+    for different clusters don't contend.
+
+    Each shard gets the full ``maxsize`` rather than an even split: hashing
+    isn't uniform over a handful of cluster ids, and a shard that fills
+    early would evict live clusters while the others sit empty. The hard
+    ceiling is therefore ``maxsize * shards`` entries.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: int = 3600, shards: int = 4):
+        self._shards = [TTLCache(maxsize=maxsize, ttl=ttl) for _ in range(shards)]
+        self._locks = [threading.RLock() for _ in range(shards)]
+
+    def _shard(self, cluster_id: str) -> int:
+        return hash(cluster_id) % len(self._shards)
+
+    def get(self, cluster_id: str) -> Optional[dict]:
+        i = self._shard(cluster_id)
+        with self._locks[i]:
+            metrics = self._shards[i].get(cluster_id)
+        (K8S_METRICS_CACHE_HITS if metrics is not None else K8S_METRICS_CACHE_MISSES).inc()
+        return metrics
+
+    def __setitem__(self, cluster_id: str, metrics: dict) -> None:
+        i = self._shard(cluster_id)
+        with self._locks[i]:
+            self._shards[i][cluster_id] = metrics
+
+    def __len__(self) -> int:
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.expire()
+                total += len(shard)
+        return total
+
+    def items(self) -> list[tuple[str, dict]]:
+        """Snapshot of all live entries, safe to iterate while pushes continue."""
+        snapshot = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                snapshot.extend(shard.items())
+        return snapshot
+
+
+_cluster_metrics = _ClusterMetricsStore()
+# Counted when /metrics is scraped, not on every agent push
+K8S_METRICS_CACHE_SIZE.set_function(lambda: len(_cluster_metrics))
+
+HOURS_PER_MONTH = 730
+
+# Rough monthly cost by instance type (AWS on-demand hourly × 730h)
+_MONTHLY_COSTS = {
+    itype: hourly * HOURS_PER_MONTH
+    for itype, hourly in {
+        "m5.large": 0.096, "m5.xlarge": 0.192, "m5.2xlarge": 0.384,
+        "m5.4xlarge": 0.768, "c5.large": 0.085, "c5.xlarge": 0.17,
+        "c5.2xlarge": 0.34, "r5.large": 0.126, "r5.xlarge": 0.252,
+        "t3.medium": 0.0416, "t3.large": 0.0832, "t3.xlarge": 0.1664,
+    }.items()
+}
+_DEFAULT_MONTHLY = 0.10 * HOURS_PER_MONTH  # fallback for unknown types
+
+
+@lru_cache(maxsize=256)
+def _fleet_monthly_cost(fleet: tuple[tuple[str, int], ...]) -> float:
+    """Monthly cost of a fleet given as sorted (instance_type, count) pairs."""
+    return sum(_MONTHLY_COSTS.get(itype, _DEFAULT_MONTHLY) * count for itype, count in fleet)
+
+
+# Per-pod numeric fields kept as columnar arrays for aggregation.
+_POD_NUMERIC_FIELDS = (
+    "cpu_request_millicores",
+    "cpu_usage_millicores",
+    "cpu_limit_millicores",
+    "memory_request_bytes",
+    "memory_usage_bytes",
+    "memory_limit_bytes",
+)
+
+
+# One C-level call pulls every field the aggregations need from a pod dict.
+_POD_KEYS = itemgetter("namespace", *_POD_NUMERIC_FIELDS)
+_POD_DEFAULTS = {"namespace": "default", **dict.fromkeys(_POD_NUMERIC_FIELDS, 0)}
+
+
+def _build_pod_arrays(pods: list[dict]) -> dict:
+    """
+    Convert the pod list into structure-of-arrays form.
+
+    Returns a dict with one float64 array per field in _POD_NUMERIC_FIELDS,
+    plus ``namespaces`` (sorted unique names) and ``ns_codes`` (index into
+    ``namespaces`` for each pod) so per-namespace sums need no grouping step.
+    """
+    try:
+        rows = [_POD_KEYS(p) for p in pods]
+    except KeyError:
+        # Some pods omit fields — fill defaults, then take the fast path
+        rows = [_POD_KEYS({**_POD_DEFAULTS, **p}) for p in pods]
+
+    n = len(rows)
+    columns = list(zip(*rows)) or [()] * (len(_POD_NUMERIC_FIELDS) + 1)
+    arrays = {
+        field: np.fromiter(column, dtype=np.float64, count=n)
+        for field, column in zip(_POD_NUMERIC_FIELDS, columns[1:])
+    }
+    namespaces = np.array(columns[0], dtype=object)
+    unique_ns, ns_codes = np.unique(namespaces, return_inverse=True)
+    arrays["namespaces"] = unique_ns
+    arrays["ns_codes"] = ns_codes
+    return arrays
+
+
+# Longer strings aren't interned so a hostile payload can't bloat the intern table.
+_MAX_INTERN_LEN = 256
+
+
+def _intern(value):
+    """Intern short strings; anything else is returned unchanged."""
+    if isinstance(value, str) and len(value) <= _MAX_INTERN_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _intern_strings(metrics: dict) -> None:
+    """
+    Deduplicate the strings repeated across replicas, in place.
+
+    Every replica of a deployment carries the same namespace and labels, and
+    most nodes share a few instance types, so interning keeps one copy of
+    each distinct string per process instead of one per pod.
+    """
+    for node in metrics.get("nodes", []):
+        if "instance_type" in node:
+            node["instance_type"] = _intern(node["instance_type"])
+    for pod in metrics.get("pods", []):
+        if "namespace" in pod:
+            pod["namespace"] = _intern(pod["namespace"])
+        labels = pod.get("labels")
+        if isinstance(labels, dict):
+            pod["labels"] = {_intern(k): _intern(v) for k, v in labels.items()}
+
+
+# (shift, suffix) from largest unit down; a value with more than ``shift``
+# significant bits is at least 2**shift bytes.
+_BYTE_UNITS = ((30, "Gi"), (20, "Mi"), (10, "Ki"))
+
+
+@lru_cache(maxsize=256)
+def _format_bytes(b: int) -> str:
+    """
+    Format bytes to human-readable string.
+
+    Memory requests cluster around a handful of sizes (64Mi, 512Mi, 1Gi...),
+    so results are memoised across recommendations.
+    """
+    bits = int(b).bit_length() if b > 0 else 0
+    for shift, suffix in _BYTE_UNITS:
+        if bits > shift:
+            return f"{b / (1 << shift):.0f}{suffix}"
+    return f"{b}B"
 
 
 class KubernetesCostService:
@@ -75,11 +254,14 @@ class KubernetesCostService:
             ]
         }
         """
-        _cluster_metrics[cluster_id] = {
+        _intern_strings(metrics)
+        stored = {
             **metrics,
             "cluster_id": cluster_id,
             "received_at": datetime.utcnow().isoformat(),
         }
+        stored["_derived"] = self._compute_derived(stored)
+        _cluster_metrics[cluster_id] = stored
         logger.info(
             f"Ingested metrics for cluster {cluster_id}: "
             f"{len(metrics.get('nodes', []))} nodes, "
@@ -87,23 +269,58 @@ class KubernetesCostService:
         )
         return {"status": "ok", "cluster_id": cluster_id}
 
+    def _compute_derived(self, metrics: dict) -> dict:
+        """
+        Precompute the values every read path needs from a metrics snapshot.
+
+        Runs once per agent push; readers use ``metrics["_derived"]`` instead
+        of re-walking the node and pod lists on each request.
+        """
+        nodes = metrics.get("nodes", [])
+        total_cluster_cost = self._estimate_cluster_cost(nodes)
+
+        # Both capacity totals in a single walk over the nodes
+        total_cpu_cap = total_mem_cap = 0
+        for n in nodes:
+            total_cpu_cap += n.get("allocatable_cpu_millicores", 0)
+            total_mem_cap += n.get("allocatable_memory_bytes", 0)
+
+        pods = metrics.get("pods", [])
+        pod_arrays = _build_pod_arrays(pods)
+        namespace_set = frozenset(p.get("namespace", "") for p in pods)
+
+        return {
+            "total_cluster_cost": total_cluster_cost,
+            "total_cpu_cap": total_cpu_cap,
+            "total_mem_cap": total_mem_cap,
+            "total_cpu_used": float(pod_arrays["cpu_usage_millicores"].sum()),
+            "total_mem_used": float(pod_arrays["memory_usage_bytes"].sum()),
+            "cost_per_millicore_month": (
+                total_cluster_cost / total_cpu_cap if total_cpu_cap > 0 else 0
+            ),
+            "namespace_set": namespace_set,
+            "namespace_count": len(namespace_set),
+            "pod_arrays": pod_arrays,
+        }
+
     def list_clusters(self) -> list[dict]:
         """List all clusters with summary stats."""
         clusters = []
         for cluster_id, metrics in _cluster_metrics.items():
             nodes = metrics.get("nodes", [])
             pods = metrics.get("pods", [])
+            derived = metrics["_derived"]
 
-            total_cpu_cap = sum(n.get("allocatable_cpu_millicores", 0) for n in nodes)
-            total_cpu_used = sum(p.get("cpu_usage_millicores", 0) for p in pods)
-            total_mem_cap = sum(n.get("allocatable_memory_bytes", 0) for n in nodes)
-            total_mem_used = sum(p.get("memory_usage_bytes", 0) for p in pods)
+            total_cpu_cap = derived["total_cpu_cap"]
+            total_cpu_used = derived["total_cpu_used"]
+            total_mem_cap = derived["total_mem_cap"]
+            total_mem_used = derived["total_mem_used"]
 
             cpu_util = (total_cpu_used / total_cpu_cap * 100) if total_cpu_cap > 0 else 0
             mem_util = (total_mem_used / total_mem_cap * 100) if total_mem_cap > 0 else 0
 
             # Estimate monthly cost based on node count and typical pricing
-            estimated_monthly = self._estimate_cluster_cost(nodes)
+            estimated_monthly = derived["total_cluster_cost"]
             idle_cost = estimated_monthly * (1 - cpu_util / 100) * 0.5  # rough idle estimate
 
             clusters.append({
@@ -113,7 +330,7 @@ class KubernetesCostService:
                 "provider": metrics.get("provider", ""),
                 "node_count": len(nodes),
                 "pod_count": len(pods),
-                "namespace_count": len(set(p.get("namespace", "") for p in pods)),
+                "namespace_count": derived["namespace_count"],
                 "cpu_utilization_pct": round(cpu_util, 1),
                 "memory_utilization_pct": round(mem_util, 1),
                 "estimated_monthly_cost": round(estimated_monthly, 2),
@@ -129,146 +346,145 @@ class KubernetesCostService:
         if not metrics:
             return []
 
-        nodes = metrics.get("nodes", [])
-        pods = metrics.get("pods", [])
+        derived = metrics["_derived"]
+        total_cluster_cost = derived["total_cluster_cost"]
+        total_cpu_cap = derived["total_cpu_cap"]
+        total_mem_cap = derived["total_mem_cap"]
 
-        total_cluster_cost = self._estimate_cluster_cost(nodes)
-        total_cpu_cap = sum(n.get("allocatable_cpu_millicores", 0) for n in nodes)
-        total_mem_cap = sum(n.get("allocatable_memory_bytes", 0) for n in nodes)
-
-        # Aggregate by namespace
-        ns_stats: dict[str, dict] = {}
-        for pod in pods:
-            ns = pod.get("namespace", "default")
-            if ns not in ns_stats:
-                ns_stats[ns] = {
-                    "pod_count": 0,
-                    "cpu_request": 0,
-                    "cpu_usage": 0,
-                    "cpu_limit": 0,
-                    "mem_request": 0,
-                    "mem_usage": 0,
-                    "mem_limit": 0,
-                }
-            s = ns_stats[ns]
-            s["pod_count"] += 1
-            s["cpu_request"] += pod.get("cpu_request_millicores", 0)
-            s["cpu_usage"] += pod.get("cpu_usage_millicores", 0)
-            s["cpu_limit"] += pod.get("cpu_limit_millicores", 0)
-            s["mem_request"] += pod.get("memory_request_bytes", 0)
-            s["mem_usage"] += pod.get("memory_usage_bytes", 0)
-            s["mem_limit"] += pod.get("memory_limit_bytes", 0)
+        # Nodes haven't reported yet — nothing to allocate against
+        if not (total_cpu_cap or total_mem_cap):
+            return []
+
+        # Aggregate by namespace in one pass over the pod arrays
+        pod_arrays = derived["pod_arrays"]
+        namespaces = pod_arrays["namespaces"]
+        pod_count, cpu_request, cpu_usage, mem_request, mem_usage = aggregate_by_ns(
+            pod_arrays["ns_codes"],
+            pod_arrays["cpu_request_millicores"],
+            pod_arrays["cpu_usage_millicores"],
+            pod_arrays["memory_request_bytes"],
+            pod_arrays["memory_usage_bytes"],
+            len(namespaces),
+        )
 
         result = []
-        for ns, s in ns_stats.items():
+        for i, ns in enumerate(namespaces):
+            cpu_req, cpu_use = cpu_request[i], cpu_usage[i]
+            mem_req, mem_use = mem_request[i], mem_usage[i]
+
             # Cost allocation: weighted 50% by CPU request, 50% by memory request
-            cpu_share = (s["cpu_request"] / total_cpu_cap) if total_cpu_cap > 0 else 0
-            mem_share = (s["mem_request"] / total_mem_cap) if total_mem_cap > 0 else 0
+            cpu_share = (cpu_req / total_cpu_cap) if total_cpu_cap > 0 else 0
+            mem_share = (mem_req / total_mem_cap) if total_mem_cap > 0 else 0
             cost_share = (cpu_share + mem_share) / 2
             ns_cost = total_cluster_cost * cost_share
 
             # Efficiency: usage / request
-            cpu_eff = (s["cpu_usage"] / s["cpu_request"] * 100) if s["cpu_request"] > 0 else 0
-            mem_eff = (s["mem_usage"] / s["mem_request"] * 100) if s["mem_request"] > 0 else 0
+            cpu_eff = (cpu_use / cpu_req * 100) if cpu_req > 0 else 0
+            mem_eff = (mem_use / mem_req * 100) if mem_req > 0 else 0
             efficiency = (cpu_eff + mem_eff) / 2
 
             result.append({
                 "namespace": ns,
-                "pod_count": s["pod_count"],
-                "cpu_request_millicores": s["cpu_request"],
-                "cpu_usage_millicores": s["cpu_usage"],
-                "memory_request_bytes": s["mem_request"],
-                "memory_usage_bytes": s["mem_usage"],
-                "estimated_monthly_cost": round(ns_cost, 2),
-                "efficiency_pct": round(efficiency, 1),
+                "pod_count": int(pod_count[i]),
+                "cpu_request_millicores": int(cpu_req),
+                "cpu_usage_millicores": int(cpu_use),
+                "memory_request_bytes": int(mem_req),
+                "memory_usage_bytes": int(mem_use),
+                "estimated_monthly_cost": round(float(ns_cost), 2),
+                "efficiency_pct": round(float(efficiency), 1),
             })
 
         result.sort(key=lambda x: x["estimated_monthly_cost"], reverse=True)
         return result
 
-    def get_rightsizing_recommendations(self, cluster_id: str) -> list[dict]:
+    def get_rightsizing_recommendations(
+        self,
+        cluster_id: str,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
         """
         Generate rightsizing recommendations for pods with over-provisioned resources.
 
-        A pod is over-provisioned if usage is < 50% of request.
+        A pod is over-provisioned if usage is < 50% of request. Ratios and
+        savings are computed over the whole pod array at once; only the
+        ``limit`` highest-savings pods (all, if None) are turned into dicts.
         """
         metrics = _cluster_metrics.get(cluster_id)
         if not metrics:
             return []
 
-        nodes = metrics.get("nodes", [])
         pods = metrics.get("pods", [])
-        total_cluster_cost = self._estimate_cluster_cost(nodes)
-        total_cpu_cap = sum(n.get("allocatable_cpu_millicores", 0) for n in nodes)
+        derived = metrics["_derived"]
+        if not (derived["total_cpu_cap"] or derived["total_mem_cap"]):
+            return []
+
+        cost_per_millicore_month = derived["cost_per_millicore_month"]
+        pod_arrays = derived["pod_arrays"]
+
+        cpu_req = pod_arrays["cpu_request_millicores"]
+        cpu_used = pod_arrays["cpu_usage_millicores"]
+        mem_req = pod_arrays["memory_request_bytes"]
+        mem_used = pod_arrays["memory_usage_bytes"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cpu_ratio = np.where(cpu_req > 0, cpu_used / cpu_req, 1.0)
+            mem_ratio = np.where(mem_req > 0, mem_used / mem_req, 1.0)
+
+        # Flag if usage is less than 50% of request
+        idx = np.flatnonzero((cpu_req != 0) & ((cpu_ratio < 0.5) | (mem_ratio < 0.5)))
+        if idx.size == 0 or (limit is not None and limit <= 0):
+            return []
+
+        # Suggest 2x of actual usage as new request (with floor)
+        suggested_cpu = np.maximum(np.trunc(cpu_used[idx] * 2), 50)
+        suggested_mem = np.maximum(np.trunc(mem_used[idx] * 2), 67108864)  # 64Mi floor
+
+        # Estimate savings
+        savings = np.maximum(0, cpu_req[idx] - suggested_cpu) * cost_per_millicore_month
+        key = np.round(savings, 2)
+
+        # Highest savings first, ties in pod order
+        if limit is not None and limit < idx.size:
+            kth = np.partition(key, idx.size - limit)[idx.size - limit]
+            above = np.flatnonzero(key > kth)
+            ties = np.flatnonzero(key == kth)[: limit - above.size]
+            selected = np.concatenate([above, ties])
+        else:
+            selected = np.arange(idx.size)
+        order = selected[np.lexsort((selected, -key[selected]))]
 
         recommendations = []
-        for pod in pods:
-            cpu_req = pod.get("cpu_request_millicores", 0)
-            cpu_used = pod.get("cpu_usage_millicores", 0)
-            mem_req = pod.get("memory_request_bytes", 0)
-            mem_used = pod.get("memory_usage_bytes", 0)
-
-            if cpu_req == 0:
-                continue
-
-            cpu_ratio = cpu_used / cpu_req if cpu_req > 0 else 1
-            mem_ratio = mem_used / mem_req if mem_req > 0 else 1
-
-            # Flag if usage is less than 50% of request
-            if cpu_ratio < 0.5 or mem_ratio < 0.5:
-                # Suggest 2x of actual usage as new request (with floor)
-                suggested_cpu = max(int(cpu_used * 2), 50)
-                suggested_mem = max(int(mem_used * 2), 67108864)  # 64Mi floor
-
-                # Estimate savings
-                cpu_saved = max(0, cpu_req - suggested_cpu)
-                cost_per_millicore_month = total_cluster_cost / total_cpu_cap if total_cpu_cap > 0 else 0
-                savings = cpu_saved * cost_per_millicore_month
-
-                recommendations.append({
-                    "pod_name": pod.get("name", ""),
-                    "namespace": pod.get("namespace", ""),
-                    "current_cpu_request": f"{cpu_req}m",
-                    "suggested_cpu_request": f"{suggested_cpu}m",
-                    "current_memory_request": self._format_bytes(mem_req),
-                    "suggested_memory_request": self._format_bytes(suggested_mem),
-                    "cpu_utilization_pct": round(cpu_ratio * 100, 1),
-                    "memory_utilization_pct": round(mem_ratio * 100, 1),
-                    "estimated_monthly_savings": round(savings, 2),
-                })
-
-        recommendations.sort(key=lambda x: x["estimated_monthly_savings"], reverse=True)
+        for j in order:
+            pod = pods[idx[j]]
+            recommendations.append({
+                "pod_name": pod.get("name", ""),
+                "namespace": pod.get("namespace", ""),
+                "current_cpu_request": f"{pod.get('cpu_request_millicores', 0)}m",
+                "suggested_cpu_request": f"{int(suggested_cpu[j])}m",
+                "current_memory_request": self._format_bytes(pod.get("memory_request_bytes", 0)),
+                "suggested_memory_request": self._format_bytes(int(suggested_mem[j])),
+                "cpu_utilization_pct": round(float(cpu_ratio[idx[j]]) * 100, 1),
+                "memory_utilization_pct": round(float(mem_ratio[idx[j]]) * 100, 1),
+                "estimated_monthly_savings": round(float(savings[j]), 2),
+            })
+
         return recommendations
 
     def _estimate_cluster_cost(self, nodes: list[dict]) -> float:
-        """Estimate monthly cluster cost based on node instance types."""
-        # Rough hourly cost by instance type (AWS on-demand)
-        HOURLY_COSTS = {
-            "m5.large": 0.096, "m5.xlarge": 0.192, "m5.2xlarge": 0.384,
-            "m5.4xlarge": 0.768, "c5.large": 0.085, "c5.xlarge": 0.17,
-            "c5.2xlarge": 0.34, "r5.large": 0.126, "r5.xlarge": 0.252,
-            "t3.medium": 0.0416, "t3.large": 0.0832, "t3.xlarge": 0.1664,
-        }
-        DEFAULT_HOURLY = 0.10  # fallback
-
-        total = 0
-        for node in nodes:
-            itype = node.get("instance_type", "")
-            hourly = HOURLY_COSTS.get(itype, DEFAULT_HOURLY)
-            total += hourly * 730  # ~730 hours/month
+        """
+        Estimate monthly cluster cost based on node instance types.
 
-        return total
+        Nodes are only counted per type; pricing runs once per distinct type
+        and is memoised per fleet shape, so repeat pushes from the same
+        cluster cost one Counter pass.
+        """
+        fleet = Counter(n.get("instance_type", "") for n in nodes)
+        return _fleet_monthly_cost(tuple(sorted(fleet.items())))
 
     @staticmethod
     def _format_bytes(b: int) -> str:
         """Format bytes to human-readable string."""
-        if b >= 1073741824:
-            return f"{b / 1073741824:.0f}Gi"
-        elif b >= 1048576:
-            return f"{b / 1048576:.0f}Mi"
-        elif b >= 1024:
-            return f"{b / 1024:.0f}Ki"
-        return f"{b}B"
+        return _format_bytes(b)
 
 
 # Module-level singleton
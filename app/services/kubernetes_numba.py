@@ -0,0 +1,66 @@
+"""
+Kubernetes Cost Allocation Kernels
+
+Numeric kernels used by the Kubernetes cost service over the per-pod
+structure-of-arrays built at ingest.
+
+Numba is optional: when it is installed the namespace aggregation is
+JIT-compiled into a single pass over the pod arrays; otherwise it falls
+back to one np.bincount per metric.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    # Serial on purpose: pods scatter into shared namespace slots, and
+    # prange has no atomic add, so a parallel loop would race.
+    @njit(cache=True)
+    def aggregate_by_ns(
+        ns_codes: np.ndarray,
+        cpu_req: np.ndarray,
+        cpu_use: np.ndarray,
+        mem_req: np.ndarray,
+        mem_use: np.ndarray,
+        n_ns: int,
+    ) -> tuple:
+        """Per-namespace (pod_count, cpu_req, cpu_use, mem_req, mem_use) sums."""
+        pod_count = np.zeros(n_ns, dtype=np.int64)
+        cpu_req_out = np.zeros(n_ns, dtype=np.float64)
+        cpu_use_out = np.zeros(n_ns, dtype=np.float64)
+        mem_req_out = np.zeros(n_ns, dtype=np.float64)
+        mem_use_out = np.zeros(n_ns, dtype=np.float64)
+        for i in range(ns_codes.shape[0]):
+            k = ns_codes[i]
+            pod_count[k] += 1
+            cpu_req_out[k] += cpu_req[i]
+            cpu_use_out[k] += cpu_use[i]
+            mem_req_out[k] += mem_req[i]
+            mem_use_out[k] += mem_use[i]
+        return pod_count, cpu_req_out, cpu_use_out, mem_req_out, mem_use_out
+
+else:
+
+    def aggregate_by_ns(
+        ns_codes: np.ndarray,
+        cpu_req: np.ndarray,
+        cpu_use: np.ndarray,
+        mem_req: np.ndarray,
+        mem_use: np.ndarray,
+        n_ns: int,
+    ) -> tuple:
+        """Per-namespace (pod_count, cpu_req, cpu_use, mem_req, mem_use) sums."""
+        return (
+            np.bincount(ns_codes, minlength=n_ns),
+            np.bincount(ns_codes, weights=cpu_req, minlength=n_ns),
+            np.bincount(ns_codes, weights=cpu_use, minlength=n_ns),
+            np.bincount(ns_codes, weights=mem_req, minlength=n_ns),
+            np.bincount(ns_codes, weights=mem_use, minlength=n_ns),
+        )
@@ -7,28 +7,177 @@ connecting your own AWS account.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 from calendar import monthrange
 
 import boto3
 from botocore.exceptions import ClientError
 
+from app.core.metrics import CE_REQUEST_DURATION
+from app.services.ce_cache import ce_cache
+
 logger = logging.getLogger(__name__)
 
+# Concurrent Cost Explorer requests per query
+MAX_WORKERS = 8
+
+# DAILY queries are only split once they span more than this many days, so
+# short ranges still cost a single API call.
+MIN_CHUNK_DAYS = 30
+
+# Rows below this amount are dropped as noise
+MIN_ROW_AMOUNT = 0.01
+
+# Cost Explorer get_cost_and_usage quota (requests per minute, per account)
+CE_REQUESTS_PER_MINUTE = 300
+
+
+class _RateLimiter:
+    """
+    Token bucket shared by every thread issuing Cost Explorer requests.
+
+    The bucket holds at most ``rpm / 60`` tokens (one second of burst) and
+    refills continuously; ``acquire()`` blocks until a token is available,
+    so throughput settles at the quota instead of tripping throttling errors.
+    """
+
+    def __init__(self, rpm: int):
+        self.rate = rpm / 60.0
+        self.capacity = max(self.rate, 1.0)
+        self.request_tokens = self.capacity
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.request_tokens = min(
+                self.capacity, self.request_tokens + (now - self.last_update) * self.rate
+            )
+            self.last_update = now
+            if self.request_tokens >= 1:
+                self.request_tokens -= 1
+                return
+            # Reserve the next token and wait for it outside the lock
+            wait = (1 - self.request_tokens) / self.rate
+            self.request_tokens -= 1
+        time.sleep(wait)
+
+
+# Services are created per request, so the bucket lives at module level.
+_limiter = _RateLimiter(rpm=CE_REQUESTS_PER_MINUTE)
+
+
+def _chunk_date_range(
+    start_date: date,
+    end_date: date,
+    granularity: str = "DAILY",
+    max_chunks: int = MAX_WORKERS,
+) -> list[tuple[date, date]]:
+    """
+    Split [start_date, end_date) into at most ``max_chunks`` contiguous ranges.
+
+    MONTHLY ranges are only cut on the 1st of a month so no month is split
+    across two requests; DAILY ranges are cut every MIN_CHUNK_DAYS days.
+    """
+    if granularity == "MONTHLY":
+        cuts = []
+        cursor = date(start_date.year, start_date.month, 1)
+        while True:
+            cursor = date(cursor.year + cursor.month // 12, cursor.month % 12 + 1, 1)
+            if cursor >= end_date:
+                break
+            cuts.append(cursor)
+    else:
+        cuts = [
+            start_date + timedelta(days=d)
+            for d in range(MIN_CHUNK_DAYS, (end_date - start_date).days, MIN_CHUNK_DAYS)
+        ]
+
+    # Merge neighbouring pieces until we're within the worker budget
+    step = -(-(len(cuts) + 1) // max_chunks)
+    cuts = cuts[step - 1::step]
+
+    bounds = [start_date, *cuts, end_date]
+    return list(zip(bounds, bounds[1:]))
+
 
 class LocalCostExplorerService:
     """Fetches AWS cost data using local/default credentials."""
 
-    def __init__(self, region: str = "us-east-1"):
+    def __init__(self, region: str = "us-east-1", account_id: Optional[str] = None):
         self.region = region
         self.session = boto3.Session(region_name=region)
+        self._limiter = _limiter
+        self._account_id = account_id
+
+    @property
+    def account_id(self) -> str:
+        """AWS account behind the local credentials; scopes cached responses."""
+        if self._account_id is None:
+            identity = self.session.client("sts", region_name="us-east-1").get_caller_identity()
+            self._account_id = identity["Account"]
+        return self._account_id
+
+    def _fetch_all_pages(self, **kwargs) -> list[dict]:
+        """Run one get_cost_and_usage query, following NextPageToken to the end."""
+        # boto3 sessions aren't thread-safe, so each worker builds its own.
+        session = boto3.session.Session(region_name=self.region)
+        ce_client = session.client("ce", region_name="us-east-1")
+
+        results_by_time = []
+        next_token = None
+        while True:
+            if next_token:
+                kwargs["NextPageToken"] = next_token
+            self._limiter.acquire()
+            with CE_REQUEST_DURATION.labels("get_cost_and_usage").time():
+                response = ce_client.get_cost_and_usage(**kwargs)
+            results_by_time.extend(response.get("ResultsByTime", []))
+            next_token = response.get("NextPageToken")
+            if not next_token:
+                return results_by_time
+
+    def _iter_cost_and_usage_chunked(
+        self,
+        start_date: date,
+        end_date: date,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """
+        Yield ResultsByTime for [start_date, end_date) from concurrent sub-ranges.
+
+        Pagination within a query is inherently sequential, so long ranges
+        are split by time instead and each chunk is fetched on its own
+        thread. Results are yielded in chronological order.
+        """
+        chunks = _chunk_date_range(start_date, end_date, kwargs.get("Granularity", "DAILY"))
+
+        def fetch(chunk: tuple[date, date]) -> list[dict]:
+            chunk_start, chunk_end = chunk
+            return self._fetch_all_pages(
+                TimePeriod={"Start": chunk_start.isoformat(), "End": chunk_end.isoformat()},
+                **kwargs,
+            )
+
+        if len(chunks) == 1:
+            yield from fetch(chunks[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as pool:
+            for chunk_results in pool.map(fetch, chunks):
+                yield from chunk_results
 
     def validate_access(self) -> bool:
         """Test that we can access Cost Explorer."""
         try:
             ce_client = self.session.client("ce", region_name="us-east-1")
             today = date.today()
+            self._limiter.acquire()
             ce_client.get_cost_and_usage(
                 TimePeriod={
                     "Start": (today - timedelta(days=1)).isoformat(),
@@ -42,6 +191,7 @@ class LocalCostExplorerService:
             logger.error(f"Access validation failed: {e}")
             return False
 
+    @ce_cache()
     def get_cost_by_service(
         self,
         start_date: date,
@@ -49,56 +199,51 @@ class LocalCostExplorerService:
         granularity: str = "DAILY",
     ) -> list[dict]:
         """Fetch cost data grouped by AWS service."""
-        ce_client = self.session.client("ce", region_name="us-east-1")
-
-        results = []
-        next_token = None
-
-        while True:
-            kwargs = {
-                "TimePeriod": {
-                    "Start": start_date.isoformat(),
-                    "End": end_date.isoformat(),
-                },
-                "Granularity": granularity,
-                "Metrics": ["UnblendedCost"],
-                "GroupBy": [
-                    {"Type": "DIMENSION", "Key": "SERVICE"},
-                ],
-            }
-            if next_token:
-                kwargs["NextPageToken"] = next_token
-
-            try:
-                response = ce_client.get_cost_and_usage(**kwargs)
-            except ClientError as e:
-                logger.error(f"Failed to fetch cost data: {e}")
-                raise
+        results = list(self.iter_cost_by_service(start_date, end_date, granularity))
+        logger.info(f"Fetched {len(results)} cost records from {start_date} to {end_date}")
+        return results
 
-            for result_by_time in response.get("ResultsByTime", []):
+    def iter_cost_by_service(
+        self,
+        start_date: date,
+        end_date: date,
+        granularity: str = "DAILY",
+    ) -> Iterator[dict]:
+        """
+        Yield service cost rows chunk by chunk as they arrive.
+
+        Only the current chunk's response is held in memory, so callers can
+        stream long ranges without materialising every row.
+        """
+        query = {
+            "Granularity": granularity,
+            "Metrics": ["UnblendedCost"],
+            "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
+        }
+        try:
+            for result_by_time in self._iter_cost_and_usage_chunked(
+                start_date, end_date, **query
+            ):
                 period_start = result_by_time["TimePeriod"]["Start"]
                 for group in result_by_time.get("Groups", []):
                     service_name = group["Keys"][0]
                     amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
                     currency = group["Metrics"]["UnblendedCost"]["Unit"]
 
-                    if amount < 0.01:
+                    if amount < MIN_ROW_AMOUNT:
                         continue
 
-                    results.append({
+                    yield {
                         "date": period_start,
                         "service": service_name,
                         "amount": round(amount, 4),
                         "currency": currency,
-                    })
-
-            next_token = response.get("NextPageToken")
-            if not next_token:
-                break
-
-        logger.info(f"Fetched {len(results)} cost records from {start_date} to {end_date}")
-        return results
+                    }
+        except ClientError as e:
+            logger.error(f"Failed to fetch cost data: {e}")
+            raise
 
+    @ce_cache()
     def get_cost_by_tag(
         self,
         start_date: date,
@@ -106,53 +251,36 @@ class LocalCostExplorerService:
         tag_key: str = "Environment",
     ) -> list[dict]:
         """Fetch cost data grouped by a specific tag."""
-        ce_client = self.session.client("ce", region_name="us-east-1")
+        try:
+            results_by_time = list(self._iter_cost_and_usage_chunked(
+                start_date,
+                end_date,
+                Granularity="MONTHLY",
+                Metrics=["UnblendedCost"],
+                GroupBy=[{"Type": "TAG", "Key": tag_key}],
+            ))
+        except ClientError as e:
+            logger.error(f"Failed to fetch tag cost data: {e}")
+            raise
 
         results = []
-        next_token = None
-
-        while True:
-            kwargs = {
-                "TimePeriod": {
-                    "Start": start_date.isoformat(),
-                    "End": end_date.isoformat(),
-                },
-                "Granularity": "MONTHLY",
-                "Metrics": ["UnblendedCost"],
-                "GroupBy": [
-                    {"Type": "TAG", "Key": tag_key},
-                ],
-            }
-            if next_token:
-                kwargs["NextPageToken"] = next_token
-
-            try:
-                response = ce_client.get_cost_and_usage(**kwargs)
-            except ClientError as e:
-                logger.error(f"Failed to fetch tag cost data: {e}")
-                raise
-
-            for result_by_time in response.get("ResultsByTime", []):
-                period_start = result_by_time["TimePeriod"]["Start"]
-                for group in result_by_time.get("Groups", []):
-                    tag_value = group["Keys"][0]
-                    # Format: "Environment$production" or "Environment$"
-                    tag_value = tag_value.split("$", 1)[1] if "$" in tag_value else tag_value
-                    if not tag_value:
-                        tag_value = "(untagged)"
-                    amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-                    if amount < 0.01:
-                        continue
-                    results.append({
-                        "date": period_start,
-                        "tag_key": tag_key,
-                        "tag_value": tag_value,
-                        "amount": round(amount, 4),
-                    })
-
-            next_token = response.get("NextPageToken")
-            if not next_token:
-                break
+        for result_by_time in results_by_time:
+            period_start = result_by_time["TimePeriod"]["Start"]
+            for group in result_by_time.get("Groups", []):
+                tag_value = group["Keys"][0]
+                # Format: "Environment$production" or "Environment$"
+                tag_value = tag_value.split("$", 1)[1] if "$" in tag_value else tag_value
+                if not tag_value:
+                    tag_value = "(untagged)"
+                amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
+                if amount < MIN_ROW_AMOUNT:
+                    continue
+                results.append({
+                    "date": period_start,
+                    "tag_key": tag_key,
+                    "tag_value": tag_value,
+                    "amount": round(amount, 4),
+                })
 
         return results
 
@@ -160,12 +288,14 @@ class LocalCostExplorerService:
         """List all tag keys that have cost data."""
         ce_client = self.session.client("ce", region_name="us-east-1")
         try:
-            response = ce_client.get_tags(
-                TimePeriod={
-                    "Start": start_date.isoformat(),
-                    "End": end_date.isoformat(),
-                },
-            )
+            self._limiter.acquire()
+            with CE_REQUEST_DURATION.labels("get_tags").time():
+                response = ce_client.get_tags(
+                    TimePeriod={
+                        "Start": start_date.isoformat(),
+                        "End": end_date.isoformat(),
+                    },
+                )
             return response.get("Tags", [])
         except ClientError as e:
             logger.error(f"Failed to fetch tags: {e}")
@@ -188,14 +318,16 @@ class LocalCostExplorerService:
                 end_date = date(start_date.year, start_date.month + 1, 1)
 
         try:
-            response = ce_client.get_cost_forecast(
-                TimePeriod={
-                    "Start": start_date.isoformat(),
-                    "End": end_date.isoformat(),
-                },
-                Metric="UNBLENDED_COST",
-                Granularity="MONTHLY",
-            )
+            self._limiter.acquire()
+            with CE_REQUEST_DURATION.labels("get_cost_forecast").time():
+                response = ce_client.get_cost_forecast(
+                    TimePeriod={
+                        "Start": start_date.isoformat(),
+                        "End": end_date.isoformat(),
+                    },
+                    Metric="UNBLENDED_COST",
+                    Granularity="MONTHLY",
+                )
             total = response.get("Total", {})
             return {
                 "total_forecast": round(float(total.get("Amount", 0)), 2),
@@ -205,8 +337,28 @@ class LocalCostExplorerService:
             }
         except ClientError as e:
             logger.warning(f"AWS forecast API failed: {e}. Falling back to linear projection.")
+            return self._linear_forecast(start_date, end_date)
+
+    def _linear_forecast(self, start_date: date, end_date: date) -> Optional[dict]:
+        """Project the last 30 days' daily average over [start_date, end_date)."""
+        today = date.today()
+        try:
+            recent = self.get_total_cost(today - timedelta(days=30), today, "DAILY")
+        except ClientError:
             return None
+        if not recent:
+            return None
+
+        daily_avg = sum(r["amount"] for r in recent) / len(recent)
+        return {
+            "total_forecast": round(daily_avg * (end_date - start_date).days, 2),
+            "currency": recent[0]["currency"],
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "projected": True,
+        }
 
+    @ce_cache()
     def get_total_cost(
         self,
         start_date: date,
@@ -217,14 +369,16 @@ class LocalCostExplorerService:
         ce_client = self.session.client("ce", region_name="us-east-1")
 
         try:
-            response = ce_client.get_cost_and_usage(
-                TimePeriod={
-                    "Start": start_date.isoformat(),
-                    "End": end_date.isoformat(),
-                },
-                Granularity=granularity,
-                Metrics=["UnblendedCost"],
-            )
+            self._limiter.acquire()
+            with CE_REQUEST_DURATION.labels("get_cost_and_usage").time():
+                response = ce_client.get_cost_and_usage(
+                    TimePeriod={
+                        "Start": start_date.isoformat(),
+                        "End": end_date.isoformat(),
+                    },
+                    Granularity=granularity,
+                    Metrics=["UnblendedCost"],
+                )
         except ClientError as e:
             logger.error(f"Failed to fetch total cost: {e}")
             raise
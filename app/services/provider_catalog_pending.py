@@ -0,0 +1,18 @@
+"""
+Provider Registry — Coming-Soon Credential Fields
+
+Credential form definitions for providers whose status is "coming_soon".
+They are kept out of provider_catalog.json so the catalog (and every catalog
+response) only carries stubs for connectors nobody can connect yet;
+provider_registry.get_provider_details imports this module on demand.
+"""
+
+PENDING_REQUIRED_FIELDS: dict[str, list[dict]] = {
+    "cloudflare": [
+        {"name": "api_token", "label": "API Token", "input_type": "password", "placeholder": "", "help_text": "Cloudflare API token with billing read.", "secret": True},
+    ],
+    "vercel": [
+        {"name": "api_token", "label": "API Token", "input_type": "password", "placeholder": "", "help_text": "Vercel personal/team API token.", "secret": True},
+        {"name": "team_id", "label": "Team ID", "input_type": "text", "placeholder": "team_...", "help_text": "Vercel team ID (optional for personal).", "secret": False},
+    ],
+}
@@ -7,14 +7,24 @@ Scans customer AWS accounts for waste:
 - Old EBS snapshots (>90 days)
 """
 
+import asyncio
+import heapq
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Any
 
 import boto3
+import numpy as np
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 
 from app.core.config import get_settings
 from app.models.models import ResourceType
+from app.services.aws_batcher import batched_describe_instances
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -39,33 +49,180 @@ EC2_HOURLY_COSTS = {
     "r5.xlarge": 0.252,
 }
 
+HOURS_PER_MONTH = 730
+
+# Monthly on-demand cost per instance type, assuming it runs all month
+EC2_MONTHLY_COSTS = {k: v * HOURS_PER_MONTH for k, v in EC2_HOURLY_COSTS.items()}
+
+# Monthly cost for instance types missing from the table ($0.05/hour)
+EC2_DEFAULT_MONTHLY_COST = 0.05 * HOURS_PER_MONTH
+
 # EBS cost per GB/month (gp2/gp3 approximate)
 EBS_GB_MONTHLY_COST = 0.08
 
 # Snapshot cost per GB/month
 SNAPSHOT_GB_MONTHLY_COST = 0.05
 
+# CloudWatch GetMetricData accepts at most this many queries per request
+METRIC_DATA_MAX_QUERIES = 500
+
+# Concurrent (scan, region) tasks in scan_all
+MAX_SCAN_WORKERS = 32
+
+# Concurrent per-load-balancer target health probes
+MAX_LB_PROBE_WORKERS = 16
+
+# Enabled regions change on the order of months
+REGIONS_TTL_SECONDS = 3600
+
+# Sized so threaded scans don't exhaust urllib3's per-client pool (default 10);
+# adaptive retries back off client-side when EC2 throttles describe calls.
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    user_agent_extra="cloudpulse-recs",
+)
+
+
+_savings = itemgetter("estimated_monthly_savings")
+
+
+def _tag(tags: list[dict], key: str, default: str = "Unnamed") -> str:
+    """Value of the first tag named ``key`` in an AWS Tags list."""
+    return next((t["Value"] for t in tags if t["Key"] == key), default)
+
 
 class RecommendationEngine:
     """Scans AWS accounts for cost optimization opportunities."""
 
-    def __init__(self, session: boto3.Session):
+    def __init__(self, session: boto3.Session, account_id: str | None = None):
         self.session = session
+        # Keys shared describe calls; looked up via STS on first use if not given
+        self._account_id = account_id
+        # Clients are thread-safe once built, but creating them from a
+        # shared Session is not, so scans running in parallel serialize here.
+        # Each (service, region) client is built once and reused by every
+        # scan, keeping its HTTPS connection pool warm.
+        self._client_lock = threading.Lock()
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._regions_cache: TTLCache = TTLCache(maxsize=1, ttl=REGIONS_TTL_SECONDS)
+
+    def _get_client(self, service: str, region: str):
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.session.client(
+                        service, region_name=region, config=CLIENT_CONFIG
+                    )
+        return client
+
+    @property
+    def account_id(self) -> str:
+        if self._account_id is None:
+            identity = self._get_client("sts", "us-east-1").get_caller_identity()
+            self._account_id = identity["Account"]
+        return self._account_id
 
     def _get_ec2_client(self, region: str):
-        return self.session.client("ec2", region_name=region)
+        return self._get_client("ec2", region)
 
     def _get_cloudwatch_client(self, region: str):
-        return self.session.client("cloudwatch", region_name=region)
+        return self._get_client("cloudwatch", region)
+
+    def _get_daily_averages(
+        self,
+        cw,
+        namespace: str,
+        metric_name: str,
+        dimension_name: str,
+        resource_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> dict[str, float]:
+        """
+        Average of the daily Average datapoints for each resource.
+
+        Batches one MetricDataQuery per resource into GetMetricData calls
+        (up to METRIC_DATA_MAX_QUERIES each) instead of one
+        GetMetricStatistics call per resource, then averages all series
+        at once over a NaN-padded (resources × days) array. Resources
+        without datapoints, or whose batch failed, are left out.
+        """
+        values: dict[str, list[float]] = {}
+
+        for offset in range(0, len(resource_ids), METRIC_DATA_MAX_QUERIES):
+            batch = resource_ids[offset:offset + METRIC_DATA_MAX_QUERIES]
+            # Query Ids must start with a lowercase letter; map them back by index
+            queries = [
+                {
+                    "Id": f"m{i}",
+                    "MetricStat": {
+                        "Metric": {
+                            "Namespace": namespace,
+                            "MetricName": metric_name,
+                            "Dimensions": [{"Name": dimension_name, "Value": resource_id}],
+                        },
+                        "Period": 86400,  # 1 day
+                        "Stat": "Average",
+                    },
+                    "ReturnData": True,
+                }
+                for i, resource_id in enumerate(batch)
+            ]
+
+            kwargs = {
+                "MetricDataQueries": queries,
+                "StartTime": start_time,
+                "EndTime": end_time,
+            }
+            try:
+                while True:
+                    response = cw.get_metric_data(**kwargs)
+                    for result in response.get("MetricDataResults", []):
+                        resource_id = batch[int(result["Id"][1:])]
+                        values.setdefault(resource_id, []).extend(result.get("Values", []))
+                    next_token = response.get("NextToken")
+                    if not next_token:
+                        break
+                    kwargs["NextToken"] = next_token
+            except ClientError as e:
+                logger.warning(
+                    f"Failed to get {metric_name} metrics for {len(batch)} resources: {e}"
+                )
+                for resource_id in batch:
+                    values.pop(resource_id, None)
+
+        series = {resource_id: points for resource_id, points in values.items() if points}
+        if not series:
+            return {}
+
+        grid = np.full((len(series), max(map(len, series.values()))), np.nan)
+        for row, points in enumerate(series.values()):
+            grid[row, :len(points)] = points
+        return dict(zip(series, np.nanmean(grid, axis=1).tolist()))
 
     def get_active_regions(self) -> list[str]:
-        """Get list of AWS regions that have EC2 resources."""
+        """
+        Get list of AWS regions that have EC2 resources.
+
+        Cached for REGIONS_TTL_SECONDS; the us-east-1 fallback used on
+        errors is not cached.
+        """
+        regions = self._regions_cache.get("regions")
+        if regions is not None:
+            return list(regions)
+
         ec2 = self._get_ec2_client("us-east-1")
         try:
             response = ec2.describe_regions(
                 Filters=[{"Name": "opt-in-status", "Values": ["opt-in-not-required", "opted-in"]}]
             )
-            return [r["RegionName"] for r in response["Regions"]]
+            regions = [r["RegionName"] for r in response["Regions"]]
+            self._regions_cache["regions"] = tuple(regions)
+            return regions
         except ClientError as e:
             logger.error(f"Failed to list regions: {e}")
             return ["us-east-1"]
@@ -85,8 +242,10 @@ class RecommendationEngine:
         cw = self._get_cloudwatch_client(region)
 
         try:
-            response = ec2.describe_instances(
-                Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
+            # Shared with any identical scan of this account/region in flight
+            instances = batched_describe_instances(
+                self.account_id, ec2,
+                [{"Name": "instance-state-name", "Values": ["running"]}],
             )
         except ClientError as e:
             logger.error(f"Failed to describe instances in {region}: {e}")
@@ -96,59 +255,49 @@ class RecommendationEngine:
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(days=lookback_days)
 
-        for reservation in response.get("Reservations", []):
-            for instance in reservation.get("Instances", []):
-                instance_id = instance["InstanceId"]
-                instance_type = instance.get("InstanceType", "unknown")
-
-                # Get average CPU utilization
-                try:
-                    metrics = cw.get_metric_statistics(
-                        Namespace="AWS/EC2",
-                        MetricName="CPUUtilization",
-                        Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400,  # 1 day
-                        Statistics=["Average"],
-                    )
-                except ClientError as e:
-                    logger.warning(f"Failed to get CPU metrics for {instance_id}: {e}")
-                    continue
-
-                datapoints = metrics.get("Datapoints", [])
-                if not datapoints:
-                    continue
-
-                avg_cpu = sum(dp["Average"] for dp in datapoints) / len(datapoints)
-
-                if avg_cpu < cpu_threshold:
-                    hourly_cost = EC2_HOURLY_COSTS.get(instance_type, 0.05)
-                    monthly_cost = hourly_cost * 730  # ~730 hours/month
-
-                    # Get instance name tag
-                    name = "Unnamed"
-                    for tag in instance.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    recommendations.append({
-                        "resource_type": ResourceType.EC2_INSTANCE.value,
-                        "resource_id": instance_id,
-                        "region": region,
-                        "recommendation": (
-                            f"Instance '{name}' ({instance_type}) has avg CPU "
-                            f"of {avg_cpu:.1f}% over {lookback_days} days. "
-                            f"Consider stopping, rightsizing, or converting to spot."
-                        ),
-                        "estimated_monthly_savings": round(monthly_cost, 2),
-                        "details": {
-                            "instance_type": instance_type,
-                            "avg_cpu": round(avg_cpu, 2),
-                            "name": name,
-                        },
-                    })
+        # Only instances running for the whole lookback window qualify, so
+        # don't spend metric queries on recently launched ones.
+        instances = [
+            instance for instance in instances
+            if not instance.get("LaunchTime") or instance["LaunchTime"] <= start_time
+        ]
+
+        # Get average CPU utilization for all instances in batched calls
+        avg_cpus = self._get_daily_averages(
+            cw, "AWS/EC2", "CPUUtilization", "InstanceId",
+            [instance["InstanceId"] for instance in instances],
+            start_time, end_time,
+        )
+
+        for instance in instances:
+            instance_id = instance["InstanceId"]
+            instance_type = instance.get("InstanceType", "unknown")
+
+            avg_cpu = avg_cpus.get(instance_id)
+            if avg_cpu is None:
+                continue
+
+            if avg_cpu < cpu_threshold:
+                monthly_cost = EC2_MONTHLY_COSTS.get(instance_type, EC2_DEFAULT_MONTHLY_COST)
+
+                name = _tag(instance.get("Tags", []), "Name")
+
+                recommendations.append({
+                    "resource_type": ResourceType.EC2_INSTANCE.value,
+                    "resource_id": instance_id,
+                    "region": region,
+                    "recommendation": (
+                        f"Instance '{name}' ({instance_type}) has avg CPU "
+                        f"of {avg_cpu:.1f}% over {lookback_days} days. "
+                        f"Consider stopping, rightsizing, or converting to spot."
+                    ),
+                    "estimated_monthly_savings": round(monthly_cost, 2),
+                    "details": {
+                        "instance_type": instance_type,
+                        "avg_cpu": round(avg_cpu, 2),
+                        "name": name,
+                    },
+                })
 
         return recommendations
 
@@ -157,26 +306,23 @@ class RecommendationEngine:
         ec2 = self._get_ec2_client(region)
 
         try:
-            response = ec2.describe_volumes(
-                Filters=[{"Name": "status", "Values": ["available"]}]
+            pages = ec2.get_paginator("describe_volumes").paginate(
+                Filters=[{"Name": "status", "Values": ["available"]}],
+                PaginationConfig={"PageSize": 500},
             )
+            volumes = [volume for page in pages for volume in page.get("Volumes", [])]
         except ClientError as e:
             logger.error(f"Failed to describe volumes in {region}: {e}")
             return []
 
         recommendations = []
 
-        for volume in response.get("Volumes", []):
+        for volume in volumes:
             volume_id = volume["VolumeId"]
             size_gb = volume.get("Size", 0)
             monthly_cost = size_gb * EBS_GB_MONTHLY_COST
 
-            # Get name tag
-            name = "Unnamed"
-            for tag in volume.get("Tags", []):
-                if tag["Key"] == "Name":
-                    name = tag["Value"]
-                    break
+            name = _tag(volume.get("Tags", []), "Name")
 
             recommendations.append({
                 "resource_type": ResourceType.EBS_VOLUME.value,
@@ -205,7 +351,15 @@ class RecommendationEngine:
         ec2 = self._get_ec2_client(region)
 
         try:
-            response = ec2.describe_snapshots(OwnerIds=["self"])
+            # start-time only supports exact/wildcard matches, not ranges, so
+            # the age cutoff is applied below; in-progress and failed
+            # snapshots are dropped server-side.
+            pages = ec2.get_paginator("describe_snapshots").paginate(
+                OwnerIds=["self"],
+                Filters=[{"Name": "status", "Values": ["completed"]}],
+                PaginationConfig={"PageSize": 1000},
+            )
+            snapshots = [snapshot for page in pages for snapshot in page.get("Snapshots", [])]
         except ClientError as e:
             logger.error(f"Failed to describe snapshots in {region}: {e}")
             return []
@@ -213,7 +367,7 @@ class RecommendationEngine:
         recommendations = []
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
 
-        for snapshot in response.get("Snapshots", []):
+        for snapshot in snapshots:
             start_time = snapshot.get("StartTime")
             if not start_time or start_time > cutoff_date:
                 continue
@@ -246,11 +400,19 @@ class RecommendationEngine:
 
     def find_idle_rds_instances(self, region: str) -> list[dict]:
         """Find RDS instances with low average connections over 7 days."""
-        rds = self.session.client("rds", region_name=region)
+        rds = self._get_client("rds", region)
         cw = self._get_cloudwatch_client(region)
 
         try:
-            response = rds.describe_db_instances()
+            pages = rds.get_paginator("describe_db_instances").paginate(
+                PaginationConfig={"PageSize": 100},  # RDS maximum
+            )
+            dbs = [
+                db
+                for page in pages
+                for db in page.get("DBInstances", [])
+                if db.get("DBInstanceStatus") == "available"
+            ]
         except ClientError as e:
             logger.error(f"Failed to describe RDS instances in {region}: {e}")
             return []
@@ -259,32 +421,20 @@ class RecommendationEngine:
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(days=7)
 
-        for db in response.get("DBInstances", []):
-            if db.get("DBInstanceStatus") != "available":
-                continue
+        avg_connections_by_id = self._get_daily_averages(
+            cw, "AWS/RDS", "DatabaseConnections", "DBInstanceIdentifier",
+            [db["DBInstanceIdentifier"] for db in dbs],
+            start_time, end_time,
+        )
 
+        for db in dbs:
             db_id = db["DBInstanceIdentifier"]
             db_class = db.get("DBInstanceClass", "unknown")
 
-            try:
-                metrics = cw.get_metric_statistics(
-                    Namespace="AWS/RDS",
-                    MetricName="DatabaseConnections",
-                    Dimensions=[{"Name": "DBInstanceIdentifier", "Value": db_id}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,
-                    Statistics=["Average"],
-                )
-            except ClientError:
+            avg_connections = avg_connections_by_id.get(db_id)
+            if avg_connections is None:
                 continue
 
-            datapoints = metrics.get("Datapoints", [])
-            if not datapoints:
-                continue
-
-            avg_connections = sum(dp["Average"] for dp in datapoints) / len(datapoints)
-
             if avg_connections < 1:
                 # Rough monthly cost estimate
                 monthly_cost = 50.00  # placeholder — use Pricing API in production
@@ -311,6 +461,7 @@ class RecommendationEngine:
         ec2 = self._get_ec2_client(region)
 
         try:
+            # Not paginated: returns every address in the region at once
             response = ec2.describe_addresses()
         except ClientError as e:
             logger.error(f"Failed to describe addresses in {region}: {e}")
@@ -335,73 +486,113 @@ class RecommendationEngine:
 
     def find_idle_load_balancers(self, region: str) -> list[dict]:
         """Find ALBs/NLBs with zero healthy targets."""
-        elbv2 = self.session.client("elbv2", region_name=region)
+        elbv2 = self._get_client("elbv2", region)
 
         try:
-            lbs = elbv2.describe_load_balancers().get("LoadBalancers", [])
+            pages = elbv2.get_paginator("describe_load_balancers").paginate(
+                PaginationConfig={"PageSize": 400},  # ELBv2 maximum
+            )
+            lbs = [lb for page in pages for lb in page.get("LoadBalancers", [])]
         except ClientError as e:
             logger.error(f"Failed to describe load balancers in {region}: {e}")
             return []
 
-        recommendations = []
-        for lb in lbs:
-            lb_arn = lb["LoadBalancerArn"]
-            lb_name = lb.get("LoadBalancerName", "")
+        def has_targets(tg: dict) -> bool:
+            health = elbv2.describe_target_health(TargetGroupArn=tg["TargetGroupArn"])
+            return bool(health.get("TargetHealthDescriptions"))
 
+        def probe(lb: dict) -> bool | None:
+            """Whether any target group has registered targets (None on error)."""
+            # Sequential within a load balancer: probes already run on the LB
+            # pool (itself inside scan_all's region pool), and any() stops at
+            # the first group with targets.
             try:
-                tgs = elbv2.describe_target_groups(LoadBalancerArn=lb_arn)
-                has_targets = False
-                for tg in tgs.get("TargetGroups", []):
-                    health = elbv2.describe_target_health(
-                        TargetGroupArn=tg["TargetGroupArn"]
-                    )
-                    if health.get("TargetHealthDescriptions"):
-                        has_targets = True
-                        break
-
-                if not has_targets:
-                    monthly_cost = 16.20 if lb.get("Type") == "application" else 22.50
-                    recommendations.append({
-                        "resource_type": ResourceType.LOAD_BALANCER.value,
-                        "resource_id": lb_name,
-                        "region": region,
-                        "recommendation": (
-                            f"{lb.get('Type', 'application').upper()} load balancer '{lb_name}' "
-                            f"has no healthy targets. Consider deleting."
-                        ),
-                        "estimated_monthly_savings": round(monthly_cost, 2),
-                        "details": {"type": lb.get("Type"), "dns": lb.get("DNSName")},
-                    })
+                tgs = elbv2.describe_target_groups(
+                    LoadBalancerArn=lb["LoadBalancerArn"]
+                ).get("TargetGroups", [])
+                return any(has_targets(tg) for tg in tgs)
             except ClientError:
+                return None
+
+        if not lbs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_LB_PROBE_WORKERS, len(lbs))) as pool:
+            probes = list(pool.map(probe, lbs))
+
+        recommendations = []
+        for lb, probe_result in zip(lbs, probes):
+            if probe_result is not False:
                 continue
 
+            lb_name = lb.get("LoadBalancerName", "")
+            monthly_cost = 16.20 if lb.get("Type") == "application" else 22.50
+            recommendations.append({
+                "resource_type": ResourceType.LOAD_BALANCER.value,
+                "resource_id": lb_name,
+                "region": region,
+                "recommendation": (
+                    f"{lb.get('Type', 'application').upper()} load balancer '{lb_name}' "
+                    f"has no healthy targets. Consider deleting."
+                ),
+                "estimated_monthly_savings": round(monthly_cost, 2),
+                "details": {"type": lb.get("Type"), "dns": lb.get("DNSName")},
+            })
+
         return recommendations
 
-    def scan_all(self, regions: list[str] | None = None) -> list[dict]:
+    def scan_all(
+        self,
+        regions: list[str] | None = None,
+        max_workers: int = MAX_SCAN_WORKERS,
+        limit: int | None = None,
+    ) -> list[dict]:
         """
         Run all recommendation scans across specified regions.
 
-        Returns combined list of all recommendations.
+        Every (scan, region) pair runs concurrently on up to ``max_workers``
+        threads, since each is bound on AWS API latency. Results are ranked
+        as scans finish; with ``limit`` only the top ``limit`` are kept.
+
+        Returns combined list of all recommendations, highest savings first.
         """
         if not regions:
             regions = ["us-east-1", "us-west-2", "eu-west-1"]  # Common defaults
 
-        all_recommendations = []
-
+        scans = (
+            self.find_idle_ec2_instances,
+            self.find_unused_ebs_volumes,
+            self.find_old_snapshots,
+            self.find_idle_rds_instances,
+            self.find_unused_elastic_ips,
+            self.find_idle_load_balancers,
+        )
+        tasks = [(scan, region) for region in regions for scan in scans]
         for region in regions:
             logger.info(f"Scanning {region} for recommendations...")
 
-            all_recommendations.extend(self.find_idle_ec2_instances(region))
-            all_recommendations.extend(self.find_unused_ebs_volumes(region))
-            all_recommendations.extend(self.find_old_snapshots(region))
-            all_recommendations.extend(self.find_idle_rds_instances(region))
-            all_recommendations.extend(self.find_unused_elastic_ips(region))
-            all_recommendations.extend(self.find_idle_load_balancers(region))
+        def rank(entry: tuple[int, int, dict]) -> tuple[float, int, int]:
+            # Highest savings first; ties keep serial scan order
+            task_index, position, rec = entry
+            return -_savings(rec), task_index, position
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as pool:
+            futures = {
+                pool.submit(scan, region): task_index
+                for task_index, (scan, region) in enumerate(tasks)
+            }
+            results = (
+                (futures[future], position, rec)
+                for future in as_completed(futures)
+                for position, rec in enumerate(future.result())
+            )
+
+            if limit is None:
+                ranked = sorted(results, key=rank)
+            else:
+                ranked = heapq.nsmallest(limit, results, key=rank)
 
-        # Sort by estimated savings (highest first)
-        all_recommendations.sort(
-            key=lambda r: r["estimated_monthly_savings"], reverse=True
-        )
+        all_recommendations = [rec for _, _, rec in ranked]
 
         total_savings = sum(r["estimated_monthly_savings"] for r in all_recommendations)
         logger.info(
@@ -410,3 +601,17 @@ class RecommendationEngine:
         )
 
         return all_recommendations
+
+    async def scan_all_async(
+        self,
+        regions: list[str] | None = None,
+        max_workers: int = MAX_SCAN_WORKERS,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """
+        Awaitable scan_all for async callers (API routes, scheduled jobs).
+
+        The scan runs on a worker thread, which fans out to its own pool,
+        so the event loop is never blocked on AWS calls.
+        """
+        return await asyncio.to_thread(self.scan_all, regions, max_workers, limit)
@@ -19,7 +19,7 @@ Usage:
 import hashlib
 import hmac
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 WEBHOOK_SECRET = "my-secret"  # Must match the secret you registered
 
@@ -29,13 +29,19 @@ class WebhookHandler(BaseHTTPRequestHandler):
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
 
-        # Verify HMAC signature (if secret is set)
+        # Verify HMAC signature (if secret is set). Raw digests are compared,
+        # so large bodies are never hex-encoded.
         sig_header = self.headers.get("X-CloudPulse-Signature", "")
         if WEBHOOK_SECRET and sig_header:
-            expected = "sha256=" + hmac.new(
-                WEBHOOK_SECRET.encode(), body, hashlib.sha256
-            ).hexdigest()
-            if not hmac.compare_digest(sig_header, expected):
+            expected = hmac.new(
+                WEBHOOK_SECRET.encode(), memoryview(body), hashlib.sha256
+            ).digest()
+            scheme, _, received_hex = sig_header.partition("=")
+            try:
+                received = bytes.fromhex(received_hex)
+            except ValueError:
+                received = b""
+            if scheme != "sha256" or not hmac.compare_digest(expected, received):
                 self.send_response(401)
                 self.end_headers()
                 self.wfile.write(b"Invalid signature")
@@ -60,7 +66,9 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
 if __name__ == "__main__":
     port = 5050
-    server = HTTPServer(("0.0.0.0", port), WebhookHandler)
+    # One thread per request, so a slow handler (e.g. forwarding to Slack)
+    # doesn't hold up the webhooks queued behind it.
+    server = ThreadingHTTPServer(("0.0.0.0", port), WebhookHandler)
     print(f"Webhook receiver listening on http://0.0.0.0:{port}/webhook")
     print("Register this URL in CloudPulse:")
     print(f'  curl -X POST http://localhost:8000/api/v2/webhooks -H "Content-Type: application/json" \\')
@@ -15,6 +15,7 @@ import asyncio
 import logging
 import sys
 import os
+from collections import defaultdict
 from datetime import date, timedelta
 
 # Add project root to path
@@ -58,46 +59,59 @@ async def run_daily_digest():
             logger.info("No alert configs with daily summary enabled.")
             return
 
+        # Each dataset is fetched for every account in one query and
+        # grouped by account here, rather than queried per account.
+        account_ids = [account.id for account in accounts]
+
+        # --- Yesterday's spend by service ---
+        cost_result = await db.execute(
+            select(
+                CostRecord.aws_account_id,
+                CostRecord.service,
+                func.sum(CostRecord.amount).label("total"),
+            )
+            .where(CostRecord.aws_account_id.in_(account_ids))
+            .where(CostRecord.date == yesterday)
+            .group_by(CostRecord.aws_account_id, CostRecord.service)
+            .order_by(func.sum(CostRecord.amount).desc())
+        )
+        top_services_by_account = defaultdict(list)
+        for row in cost_result.all():
+            top_services_by_account[row.aws_account_id].append(
+                {"service": row.service, "amount": round(row.total, 2)}
+            )
+
+        # --- Recent anomalies (last 24h) ---
+        anomaly_result = await db.execute(
+            select(Anomaly.aws_account_id, func.count(Anomaly.id))
+            .where(Anomaly.aws_account_id.in_(account_ids))
+            .where(Anomaly.date >= yesterday)
+            .where(Anomaly.acknowledged == False)
+            .group_by(Anomaly.aws_account_id)
+        )
+        anomaly_counts = dict(anomaly_result.all())
+
+        # --- Active budgets ---
+        budget_result = await db.execute(
+            select(Budget)
+            .where(Budget.aws_account_id.in_(account_ids))
+            .where(Budget.is_active == True)
+        )
+        budgets_by_account = defaultdict(list)
+        for b in budget_result.scalars().all():
+            budgets_by_account[b.aws_account_id].append(b)
+
         for account in accounts:
             account_name = account.account_name or account.aws_account_id
             logger.info(f"Processing digest for account: {account_name}")
 
-            # --- Yesterday's spend by service ---
-            cost_result = await db.execute(
-                select(
-                    CostRecord.service,
-                    func.sum(CostRecord.amount).label("total"),
-                )
-                .where(CostRecord.aws_account_id == account.id)
-                .where(CostRecord.date == yesterday)
-                .group_by(CostRecord.service)
-                .order_by(func.sum(CostRecord.amount).desc())
-            )
-            service_rows = cost_result.all()
-            top_services = [
-                {"service": row.service, "amount": round(row.total, 2)}
-                for row in service_rows
-            ]
+            top_services = top_services_by_account.get(account.id, [])
             total_spend = sum(s["amount"] for s in top_services)
-
-            # --- Recent anomalies (last 24h) ---
-            anomaly_result = await db.execute(
-                select(func.count(Anomaly.id))
-                .where(Anomaly.aws_account_id == account.id)
-                .where(Anomaly.date >= yesterday)
-                .where(Anomaly.acknowledged == False)
-            )
-            anomaly_count = anomaly_result.scalar() or 0
+            anomaly_count = anomaly_counts.get(account.id, 0)
 
             # --- Budget alerts ---
-            budget_result = await db.execute(
-                select(Budget)
-                .where(Budget.aws_account_id == account.id)
-                .where(Budget.is_active == True)
-            )
-            budgets = budget_result.scalars().all()
             budget_warnings = []
-            for b in budgets:
+            for b in budgets_by_account.get(account.id, []):
                 if b.amount > 0 and b.current_spend / b.amount >= b.alert_at_pct:
                     pct = round(b.current_spend / b.amount * 100)
                     budget_warnings.append(
@@ -147,4 +161,9 @@ async def run_daily_digest():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_daily_digest())
+    try:
+        import uvloop  # installed with uvicorn[standard] on Linux/macOS
+    except ImportError:
+        asyncio.run(run_daily_digest())
+    else:
+        uvloop.run(run_daily_digest())
@@ -7,16 +7,46 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import text
+
 from app.core.database import engine, Base
 from app.models.models import (
     User, AWSAccount, CostRecord, Anomaly, Recommendation, AlertConfig, Budget, SharedReport
 )
 
 
+# Unique keys that sync upserts use as ON CONFLICT targets. create_all
+# only adds them to new tables, so databases created before they existed
+# get them here (after collapsing any duplicate rows, keeping the newest).
+UPSERT_KEYS = {
+    "uq_cost_records_account_date_service": ("cost_records", "aws_account_id, date, service"),
+    "uq_anomalies_account_date_service": ("anomalies", "aws_account_id, date, service"),
+}
+
+
+async def ensure_upsert_keys(conn) -> None:
+    """Idempotently add the UPSERT_KEYS unique indexes to existing tables."""
+    for index_name, (table, columns) in UPSERT_KEYS.items():
+        exists = await conn.scalar(text("SELECT to_regclass(:name)"), {"name": index_name})
+        if exists is not None:
+            continue
+        keys = " AND ".join(f"a.{c} = b.{c}" for c in columns.split(", "))
+        deleted = await conn.execute(text(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE {keys} AND (a.created_at, a.id) < (b.created_at, b.id)"
+        ))
+        if deleted.rowcount:
+            print(f"🧹 Removed {deleted.rowcount} duplicate rows from {table}")
+        await conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})"
+        ))
+
+
 async def init_db():
     """Create all tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await ensure_upsert_keys(conn)
     print("✅ All database tables created successfully!")
 
     # Print table names
@@ -28,4 +58,9 @@ async def init_db():
 
 
 if __name__ == "__main__":
-    asyncio.run(init_db())
+    try:
+        import uvloop  # installed with uvicorn[standard] on Linux/macOS
+    except ImportError:
+        asyncio.run(init_db())
+    else:
+        uvloop.run(init_db())
@@ -9,12 +9,13 @@ import asyncio
 import sys
 import os
 import uuid
-from datetime import date, timedelta, datetime
+from datetime import date, timedelta, datetime, timezone
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import boto3
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.database import async_session
 from app.models.models import AWSAccount, CostRecord, AccountStatus, User
@@ -31,25 +32,23 @@ async def sync():
     print(f"🔗 AWS Account: {aws_account_id}")
 
     async with async_session() as session:
-        # --- Ensure a dev user exists ---
-        result = await session.execute(
-            select(User).where(User.email == "dev@cloudpulse.local")
+        # --- Ensure a dev user exists (one INSERT ... ON CONFLICT ... RETURNING) ---
+        stmt = pg_insert(User).values(
+            email="dev@cloudpulse.local",
+            hashed_password="not-a-real-hash-local-dev-only",
+            is_active=True,
         )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            user = User(
-                email="dev@cloudpulse.local",
-                hashed_password="not-a-real-hash-local-dev-only",
-                is_active=True,
-            )
-            session.add(user)
-            await session.flush()
-            print(f"👤 Created dev user: {user.id}")
-        else:
-            print(f"👤 Using existing dev user: {user.id}")
+        user = await session.scalar(
+            stmt.on_conflict_do_update(
+                index_elements=["email"],
+                set_={"email": stmt.excluded.email},  # no-op, so RETURNING yields the row
+            ).returning(User)
+        )
+        print(f"👤 Using dev user: {user.id}")
 
         # --- Ensure AWS account record exists ---
+        # aws_account_id isn't unique (several users may connect one AWS
+        # account), so there is no conflict target to upsert on.
         result = await session.execute(
             select(AWSAccount).where(AWSAccount.aws_account_id == aws_account_id)
         )
@@ -57,6 +56,7 @@ async def sync():
 
         if not account:
             account = AWSAccount(
+                id=uuid.uuid4(),  # known up front, so no flush is needed here
                 user_id=user.id,
                 aws_account_id=aws_account_id,
                 role_arn=f"arn:aws:iam::{aws_account_id}:user/local",
@@ -65,13 +65,12 @@ async def sync():
                 status=AccountStatus.ACTIVE,
             )
             session.add(account)
-            await session.flush()
             print(f"☁️  Created account record: {account.id}")
         else:
             print(f"☁️  Using existing account: {account.id}")
 
         # --- Fetch cost data (last 30 days) ---
-        svc = LocalCostExplorerService()
+        svc = LocalCostExplorerService(account_id=aws_account_id)
         end_date = date.today()
         start_date = end_date - timedelta(days=30)
 
@@ -79,77 +78,124 @@ async def sync():
         cost_data = svc.get_cost_by_service(start_date, end_date)
         print(f"   Found {len(cost_data)} cost records")
 
-        # --- Clear old records for this period ---
-        await session.execute(
-            delete(CostRecord)
+        # --- Run anomaly detection ---
+        # Pure CPU work over cost_data; run it in a worker thread so it
+        # overlaps the cost-record round trips below. Both writes stay in
+        # this session's single transaction (the account row may not be
+        # committed yet, so a second connection couldn't reference it).
+        print("🔍 Running anomaly detection...")
+        detector = AnomalyDetector()
+        detection = asyncio.create_task(asyncio.to_thread(detector.detect, cost_data))
+
+        # --- Upsert records for this period ---
+        # Keyed on (account, date, service), so unchanged rows are updated
+        # in place instead of deleted and re-inserted. The summary totals
+        # are accumulated in the same pass.
+        cost_rows: dict[tuple[date, str], dict] = {}
+        # ~30 distinct dates across thousands of rows: parse each once
+        dates = {d: date.fromisoformat(d) for d in {record["date"] for record in cost_data}}
+        total_spend = 0.0
+        for record in cost_data:
+            total_spend += record["amount"]
+            key = (dates[record["date"]], record["service"])
+            row = cost_rows.get(key)
+            if row is None:
+                cost_rows[key] = {
+                    "aws_account_id": account.id,
+                    "date": key[0],
+                    "service": key[1],
+                    "amount": record["amount"],
+                    "currency": record["currency"],
+                }
+            else:
+                row["amount"] += record["amount"]
+
+        # Rows from an earlier sync that no longer appear are the only deletes
+        existing = await session.execute(
+            select(CostRecord.id, CostRecord.date, CostRecord.service)
             .where(CostRecord.aws_account_id == account.id)
             .where(CostRecord.date >= start_date)
             .where(CostRecord.date <= end_date)
         )
+        stale_ids = [row.id for row in existing if (row.date, row.service) not in cost_rows]
+        if stale_ids:
+            await session.execute(delete(CostRecord).where(CostRecord.id.in_(stale_ids)))
 
-        # --- Insert new records ---
-        total_spend = 0
-        services_seen = set()
-
-        for record in cost_data:
-            cr = CostRecord(
-                aws_account_id=account.id,
-                date=date.fromisoformat(record["date"]),
-                service=record["service"],
-                amount=record["amount"],
-                currency=record["currency"],
+        if cost_rows:
+            stmt = pg_insert(CostRecord)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["aws_account_id", "date", "service"],
+                    set_={c: stmt.excluded[c] for c in ("amount", "currency")},
+                ),
+                list(cost_rows.values()),
             )
-            session.add(cr)
-            total_spend += record["amount"]
-            services_seen.add(record["service"])
 
-        # --- Run anomaly detection ---
-        print("🔍 Running anomaly detection...")
-        detector = AnomalyDetector()
-        anomalies = detector.detect(cost_data)
+        services_seen = {service for _, service in cost_rows}
+
+        anomalies = await detection
 
-        # Clear old anomalies for the target date
+        # Upsert anomalies for the target date; ones no longer detected are
+        # removed. Re-detected anomalies keep their acknowledged flag.
         if anomalies:
             target_date = date.fromisoformat(anomalies[0]["date"])
             await session.execute(
                 delete(Anomaly)
                 .where(Anomaly.aws_account_id == account.id)
                 .where(Anomaly.date == target_date)
+                .where(Anomaly.service.not_in({a["service"] for a in anomalies}))
             )
 
-        for a in anomalies:
-            anomaly = Anomaly(
-                aws_account_id=account.id,
-                date=date.fromisoformat(a["date"]),
-                service=a["service"],
-                expected_amount=a["expected_amount"],
-                actual_amount=a["actual_amount"],
-                deviation_pct=a["deviation_pct"],
-                severity=a["severity"],
+            stmt = pg_insert(Anomaly)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["aws_account_id", "date", "service"],
+                    set_={
+                        c: stmt.excluded[c]
+                        for c in ("expected_amount", "actual_amount", "deviation_pct", "severity")
+                    },
+                ),
+                [
+                    {
+                        "aws_account_id": account.id,
+                        "date": target_date,  # detect() reports a single date
+                        "service": a["service"],
+                        "expected_amount": a["expected_amount"],
+                        "actual_amount": a["actual_amount"],
+                        "deviation_pct": a["deviation_pct"],
+                        "severity": a["severity"],
+                    }
+                    for a in anomalies
+                ],
             )
-            session.add(anomaly)
 
         # --- Update account sync time ---
-        account.last_sync_at = datetime.utcnow()
+        # Column is naive UTC (timestamp without time zone)
+        account.last_sync_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
         await session.commit()
 
-        # --- Summary ---
-        print(f"\n✅ Sync complete!")
-        print(f"   📅 Period: {start_date} → {end_date}")
-        print(f"   💰 Total spend: ${total_spend:.2f}")
-        print(f"   🏷️  Services: {len(services_seen)}")
-        print(f"   📝 Cost records stored: {len(cost_data)}")
-        print(f"   ⚠️  Anomalies detected: {len(anomalies)}")
+        # --- Summary (assembled, then written in one call) ---
+        lines = [
+            "\n✅ Sync complete!",
+            f"   📅 Period: {start_date} → {end_date}",
+            f"   💰 Total spend: ${total_spend:.2f}",
+            f"   🏷️  Services: {len(services_seen)}",
+            f"   📝 Cost records stored: {len(cost_data)}",
+            f"   ⚠️  Anomalies detected: {len(anomalies)}",
+        ]
 
         if anomalies:
-            print(f"\n   Anomaly details:")
-            for a in anomalies:
-                print(f"   {a['severity'].upper():>8} | {a['service'][:40]:<40} | "
-                      f"expected ${a['expected_amount']:.2f} → actual ${a['actual_amount']:.2f} "
-                      f"(+{a['deviation_pct']*100:.0f}%)")
+            lines.append("\n   Anomaly details:")
+            lines.extend(
+                f"   {a['severity'].upper():>8} | {a['service'][:40]:<40} | "
+                f"expected ${a['expected_amount']:.2f} → actual ${a['actual_amount']:.2f} "
+                f"(+{a['deviation_pct']*100:.0f}%)"
+                for a in anomalies
+            )
 
-        print(f"\n   Account ID (for API queries): {account.id}")
+        lines.append(f"\n   Account ID (for API queries): {account.id}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -23,9 +23,18 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import httpx
+import orjson
+
+# One pooled, keep-alive HTTP/2 connection serves a session's sequential
+# calls, so only the first request pays for the TCP + TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
 
 
 class CloudPulseError(Exception):
@@ -37,6 +46,17 @@ class CloudPulseError(Exception):
         super().__init__(f"HTTP {status_code}: {detail}")
 
 
+def _raise_for(resp: httpx.Response) -> None:
+    """Raise CloudPulseError for a 4xx/5xx response; successes return untouched."""
+    if resp.status_code < 400:
+        return
+    try:
+        detail = orjson.loads(resp.content).get("detail", resp.text)
+    except (orjson.JSONDecodeError, AttributeError):
+        detail = resp.text
+    raise CloudPulseError(resp.status_code, detail)
+
+
 class CloudPulseClient:
     """Synchronous client for the CloudPulse v2 API."""
 
@@ -51,7 +71,13 @@ class CloudPulseClient:
         headers = {"Content-Type": "application/json"}
         if token:
             headers["Authorization"] = f"Bearer {token}"
-        self._client = httpx.Client(headers=headers, timeout=timeout)
+        # The /api/v2 prefix is bound once here; calls pass relative paths
+        self._client = httpx.Client(
+            base_url=self._v2,
+            headers=headers,
+            timeout=timeout,
+            transport=httpx.HTTPTransport(http2=True, limits=DEFAULT_LIMITS, retries=1),
+        )
 
     def close(self):
         self._client.close()
@@ -65,22 +91,33 @@ class CloudPulseClient:
     # ── HTTP helpers ──────────────────────────────────────────────
 
     def _request(self, method: str, path: str, **kwargs) -> Any:
-        url = f"{self._v2}{path}"
-        resp = self._client.request(method, url, **kwargs)
-        if resp.status_code >= 400:
-            detail = resp.json().get("detail", resp.text) if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise CloudPulseError(resp.status_code, detail)
-        return resp.json()
+        resp = self._client.request(method, path, **kwargs)
+        _raise_for(resp)
+        return orjson.loads(resp.content)
 
     def _get(self, path: str, **params) -> Any:
         return self._request("GET", path, params=params)
 
-    def _post(self, path: str, json: Any = None) -> Any:
-        return self._request("POST", path, json=json)
+    def _post(self, path: str, json: Any = None, params: Optional[dict] = None) -> Any:
+        # Bodies are encoded with orjson; the session already sends
+        # Content-Type: application/json.
+        if json is None:
+            return self._request("POST", path, params=params)
+        return self._request("POST", path, content=orjson.dumps(json), params=params)
 
     def _delete(self, path: str) -> Any:
         return self._request("DELETE", path)
 
+    def _iter_pages(self, path: str, key: str, limit: int) -> Iterator[dict]:
+        """Yield ``key`` rows from every page of a list endpoint, following ``links.next``."""
+        page = 1
+        while True:
+            data = self._get(path, page=page, limit=limit)
+            yield from data.get(key, [])
+            if not data.get("links", {}).get("next"):
+                break
+            page += 1
+
     # ── Integrations ─────────────────────────────────────────────
 
     def get_catalog(self) -> dict:
@@ -125,11 +162,7 @@ class CloudPulseClient:
             params["start_date"] = start_date
         if end_date:
             params["end_date"] = end_date
-        path = f"/integrations/{integration_id}/sync"
-        if params:
-            qs = "&".join(f"{k}={v}" for k, v in params.items())
-            path = f"{path}?{qs}"
-        return self._post(path)
+        return self._post(f"/integrations/{integration_id}/sync", params=params)
 
     def disconnect(self, integration_id: str) -> dict:
         """Disconnect an integration."""
@@ -181,6 +214,10 @@ class CloudPulseClient:
     def list_tokens(self, page: int = 1, limit: int = 25) -> dict:
         return self._get("/api_tokens", page=page, limit=limit)
 
+    def iter_tokens(self, limit: int = 100) -> Iterator[dict]:
+        """Yield every API token across all pages (prefer over list_tokens for "all")."""
+        return self._iter_pages("/api_tokens", "api_tokens", limit)
+
     def create_token(self, name: str, scopes: str = "read") -> dict:
         return self._post("/api_tokens", json={"name": name, "scopes": scopes})
 
@@ -1,6 +1,7 @@
 """CloudPulse Python SDK — Cloud Cost Management API client."""
 
 from cloudpulse.client import CloudPulseClient, CloudPulseError
+from cloudpulse.async_client import AsyncCloudPulseClient
 from cloudpulse.models import (
     Workspace, WorkspaceList,
     CostReport, CostReportList,
@@ -20,6 +21,7 @@ __version__ = "0.1.0"
 
 __all__ = [
     "CloudPulseClient",
+    "AsyncCloudPulseClient",
     "CloudPulseError",
     "Workspace", "WorkspaceList",
     "CostReport", "CostReportList",
@@ -0,0 +1,369 @@
+"""
+CloudPulse Python SDK async client.
+
+Same resource namespaces as CloudPulseClient, with awaitable methods, so
+independent calls can run concurrently:
+
+    async with AsyncCloudPulseClient(api_token="cpls_...") as client:
+        workspaces, reports = await asyncio.gather(
+            client.workspaces.list(),
+            client.cost_reports.list(),
+        )
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+import httpx
+import orjson
+
+from cloudpulse.client import DEFAULT_LIMITS, CloudPulseError, ModelT
+from cloudpulse.models import (
+    Workspace, WorkspaceList,
+    CostReport, CostReportList,
+    Folder, FolderList,
+    SavedFilter, SavedFilterList,
+    Dashboard, DashboardList,
+    Segment, SegmentList,
+    Team, TeamList,
+    AccessGrant, AccessGrantList,
+    VirtualTag, VirtualTagList,
+    APITokenCreated, APITokenList,
+    ResourceReport, ResourceReportList,
+    Message,
+)
+
+
+class AsyncCloudPulseClient:
+    """
+    Asynchronous client for the CloudPulse v2 API.
+
+    Usage:
+        client = AsyncCloudPulseClient(api_token="cpls_...")
+        workspaces = await client.workspaces.list()
+    """
+
+    DEFAULT_BASE_URL = "https://api.cloudpulse.dev"
+    API_VERSION = "v2"
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 30.0,
+    ):
+        self._base_url = f"{base_url.rstrip('/')}/api/{self.API_VERSION}"
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers={
+                "Authorization": f"Bearer {api_token}",
+                "Content-Type": "application/json",
+                "User-Agent": "cloudpulse-python/0.1.0",
+            },
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=DEFAULT_LIMITS, retries=1),
+        )
+
+        # Resource namespaces
+        self.workspaces = AsyncWorkspacesResource(self)
+        self.cost_reports = AsyncCostReportsResource(self)
+        self.folders = AsyncFoldersResource(self)
+        self.saved_filters = AsyncSavedFiltersResource(self)
+        self.dashboards = AsyncDashboardsResource(self)
+        self.segments = AsyncSegmentsResource(self)
+        self.teams = AsyncTeamsResource(self)
+        self.access_grants = AsyncAccessGrantsResource(self)
+        self.virtual_tags = AsyncVirtualTagsResource(self)
+        self.api_tokens = AsyncAPITokensResource(self)
+        self.resource_reports = AsyncResourceReportsResource(self)
+
+    async def _request(self, method: str, path: str, model: type[ModelT] | None = None, **kwargs) -> Any:
+        """Send a request; with ``model``, parse and validate the raw body in one pass."""
+        response = await self._client.request(method, path, **kwargs)
+        if response.status_code >= 400:
+            detail = ""
+            try:
+                body = orjson.loads(response.content)
+                detail = body.get("detail", "")
+            except Exception:
+                detail = response.text
+            raise CloudPulseError(
+                f"API error {response.status_code}: {detail}",
+                status_code=response.status_code,
+                detail=detail,
+            )
+        if model is not None:
+            return model.model_validate_json(response.content)
+        return orjson.loads(response.content)
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+# ---------------------------------------------------------------------------
+# Resource classes
+# ---------------------------------------------------------------------------
+
+class _AsyncResource:
+    _items = ""  # field holding the rows in this resource's list response
+
+    def __init__(self, client: AsyncCloudPulseClient):
+        self._client = client
+
+    async def iter(self, limit: int = 100, **filters) -> AsyncIterator[Any]:
+        """
+        Yield every item across all pages, following ``links.next``.
+
+        Use as ``async for item in client.workspaces.iter(): ...``.
+        """
+        page = 1
+        while True:
+            result = await self.list(page=page, limit=limit, **filters)
+            for item in getattr(result, self._items):
+                yield item
+            if not result.links.get("next"):
+                break
+            page += 1
+
+    async def _get(self, model: type[ModelT], path: str, **params) -> ModelT:
+        return await self._client._request("GET", path, model, params=params)
+
+    async def _post(self, model: type[ModelT], path: str, data: dict) -> ModelT:
+        return await self._client._request("POST", path, model, content=orjson.dumps(data))
+
+    async def _put(self, model: type[ModelT], path: str, data: dict) -> ModelT:
+        return await self._client._request("PUT", path, model, content=orjson.dumps(data))
+
+    async def _delete(self, model: type[ModelT], path: str) -> ModelT:
+        return await self._client._request("DELETE", path, model)
+
+
+class AsyncWorkspacesResource(_AsyncResource):
+    _items = "workspaces"
+
+    async def list(self, page: int = 1, limit: int = 25) -> WorkspaceList:
+        return await self._get(WorkspaceList, "/workspaces", page=page, limit=limit)
+
+    async def get(self, token: str) -> Workspace:
+        return await self._get(Workspace, f"/workspaces/{token}")
+
+    async def create(self, name: str) -> Workspace:
+        return await self._post(Workspace, "/workspaces", {"name": name})
+
+    async def update(self, token: str, name: str) -> Workspace:
+        return await self._put(Workspace, f"/workspaces/{token}", {"name": name})
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/workspaces/{token}")
+
+
+class AsyncCostReportsResource(_AsyncResource):
+    _items = "cost_reports"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> CostReportList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(CostReportList, "/cost_reports", **params)
+
+    async def get(self, token: str) -> CostReport:
+        return await self._get(CostReport, f"/cost_reports/{token}")
+
+    async def create(self, **kwargs) -> CostReport:
+        return await self._post(CostReport, "/cost_reports", kwargs)
+
+    async def update(self, token: str, **kwargs) -> CostReport:
+        return await self._put(CostReport, f"/cost_reports/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/cost_reports/{token}")
+
+
+class AsyncFoldersResource(_AsyncResource):
+    _items = "folders"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> FolderList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(FolderList, "/folders", **params)
+
+    async def get(self, token: str) -> Folder:
+        return await self._get(Folder, f"/folders/{token}")
+
+    async def create(self, **kwargs) -> Folder:
+        return await self._post(Folder, "/folders", kwargs)
+
+    async def update(self, token: str, **kwargs) -> Folder:
+        return await self._put(Folder, f"/folders/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/folders/{token}")
+
+
+class AsyncSavedFiltersResource(_AsyncResource):
+    _items = "saved_filters"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> SavedFilterList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(SavedFilterList, "/saved_filters", **params)
+
+    async def get(self, token: str) -> SavedFilter:
+        return await self._get(SavedFilter, f"/saved_filters/{token}")
+
+    async def create(self, **kwargs) -> SavedFilter:
+        return await self._post(SavedFilter, "/saved_filters", kwargs)
+
+    async def update(self, token: str, **kwargs) -> SavedFilter:
+        return await self._put(SavedFilter, f"/saved_filters/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/saved_filters/{token}")
+
+
+class AsyncDashboardsResource(_AsyncResource):
+    _items = "dashboards"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> DashboardList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(DashboardList, "/dashboards", **params)
+
+    async def get(self, token: str) -> Dashboard:
+        return await self._get(Dashboard, f"/dashboards/{token}")
+
+    async def create(self, **kwargs) -> Dashboard:
+        return await self._post(Dashboard, "/dashboards", kwargs)
+
+    async def update(self, token: str, **kwargs) -> Dashboard:
+        return await self._put(Dashboard, f"/dashboards/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/dashboards/{token}")
+
+
+class AsyncSegmentsResource(_AsyncResource):
+    _items = "segments"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> SegmentList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(SegmentList, "/segments", **params)
+
+    async def get(self, token: str) -> Segment:
+        return await self._get(Segment, f"/segments/{token}")
+
+    async def create(self, **kwargs) -> Segment:
+        return await self._post(Segment, "/segments", kwargs)
+
+    async def update(self, token: str, **kwargs) -> Segment:
+        return await self._put(Segment, f"/segments/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/segments/{token}")
+
+
+class AsyncTeamsResource(_AsyncResource):
+    _items = "teams"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> TeamList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(TeamList, "/teams", **params)
+
+    async def get(self, token: str) -> Team:
+        return await self._get(Team, f"/teams/{token}")
+
+    async def create(self, **kwargs) -> Team:
+        return await self._post(Team, "/teams", kwargs)
+
+    async def update(self, token: str, **kwargs) -> Team:
+        return await self._put(Team, f"/teams/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/teams/{token}")
+
+
+class AsyncAccessGrantsResource(_AsyncResource):
+    _items = "access_grants"
+
+    async def list(self, team_token: str | None = None, page: int = 1, limit: int = 25) -> AccessGrantList:
+        params = {"page": page, "limit": limit}
+        if team_token:
+            params["team_token"] = team_token
+        return await self._get(AccessGrantList, "/access_grants", **params)
+
+    async def create(self, **kwargs) -> AccessGrant:
+        return await self._post(AccessGrant, "/access_grants", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/access_grants/{token}")
+
+
+class AsyncVirtualTagsResource(_AsyncResource):
+    _items = "virtual_tags"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> VirtualTagList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(VirtualTagList, "/virtual_tags", **params)
+
+    async def get(self, token: str) -> VirtualTag:
+        return await self._get(VirtualTag, f"/virtual_tags/{token}")
+
+    async def create(self, **kwargs) -> VirtualTag:
+        return await self._post(VirtualTag, "/virtual_tags", kwargs)
+
+    async def update(self, token: str, **kwargs) -> VirtualTag:
+        return await self._put(VirtualTag, f"/virtual_tags/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/virtual_tags/{token}")
+
+
+class AsyncAPITokensResource(_AsyncResource):
+    _items = "api_tokens"
+
+    async def list(self, page: int = 1, limit: int = 25) -> APITokenList:
+        return await self._get(APITokenList, "/api_tokens", page=page, limit=limit)
+
+    async def create(self, name: str, scopes: str = "read") -> APITokenCreated:
+        return await self._post(APITokenCreated, "/api_tokens", {"name": name, "scopes": scopes})
+
+    async def revoke(self, token_prefix: str) -> Message:
+        return await self._delete(Message, f"/api_tokens/{token_prefix}")
+
+
+class AsyncResourceReportsResource(_AsyncResource):
+    _items = "resource_reports"
+
+    async def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> ResourceReportList:
+        params = {"page": page, "limit": limit}
+        if workspace_token:
+            params["workspace_token"] = workspace_token
+        return await self._get(ResourceReportList, "/resource_reports", **params)
+
+    async def get(self, token: str) -> ResourceReport:
+        return await self._get(ResourceReport, f"/resource_reports/{token}")
+
+    async def create(self, **kwargs) -> ResourceReport:
+        return await self._post(ResourceReport, "/resource_reports", kwargs)
+
+    async def update(self, token: str, **kwargs) -> ResourceReport:
+        return await self._put(ResourceReport, f"/resource_reports/{token}", kwargs)
+
+    async def delete(self, token: str) -> Message:
+        return await self._delete(Message, f"/resource_reports/{token}")
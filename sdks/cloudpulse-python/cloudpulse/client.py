@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator, TypeVar
 
 import httpx
+import orjson
+from pydantic import BaseModel
 
 from cloudpulse.models import (
     Workspace, WorkspaceList,
@@ -21,6 +23,16 @@ from cloudpulse.models import (
     Message,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# One pooled, keep-alive HTTP/2 connection serves a session's sequential
+# calls, so only the first request pays for the TCP + TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
 
 class CloudPulseError(Exception):
     """Base exception for CloudPulse SDK errors."""
@@ -58,6 +70,7 @@ class CloudPulseClient:
                 "User-Agent": "cloudpulse-python/0.1.0",
             },
             timeout=timeout,
+            transport=httpx.HTTPTransport(http2=True, limits=DEFAULT_LIMITS, retries=1),
         )
 
         # Resource namespaces
@@ -73,12 +86,18 @@ class CloudPulseClient:
         self.api_tokens = APITokensResource(self)
         self.resource_reports = ResourceReportsResource(self)
 
-    def _request(self, method: str, path: str, **kwargs) -> dict:
+    def _request(self, method: str, path: str, model: type[ModelT] | None = None, **kwargs) -> Any:
+        """
+        Send a request and return the decoded body.
+
+        With ``model``, the raw body is parsed and validated by pydantic in
+        one pass (no intermediate dict), returning a ``model`` instance.
+        """
         response = self._client.request(method, path, **kwargs)
         if response.status_code >= 400:
             detail = ""
             try:
-                body = response.json()
+                body = orjson.loads(response.content)
                 detail = body.get("detail", "")
             except Exception:
                 detail = response.text
@@ -87,7 +106,9 @@ class CloudPulseClient:
                 status_code=response.status_code,
                 detail=detail,
             )
-        return response.json()
+        if model is not None:
+            return model.model_validate_json(response.content)
+        return orjson.loads(response.content)
 
     def close(self):
         self._client.close()
@@ -104,219 +125,259 @@ class CloudPulseClient:
 # ---------------------------------------------------------------------------
 
 class _Resource:
+    _items = ""  # field holding the rows in this resource's list response
+
     def __init__(self, client: CloudPulseClient):
         self._client = client
 
-    def _get(self, path: str, **params) -> dict:
-        return self._client._request("GET", path, params=params)
+    def iter(self, limit: int = 100, **filters) -> Iterator[Any]:
+        """
+        Yield every item across all pages, following ``links.next``.
 
-    def _post(self, path: str, data: dict) -> dict:
-        return self._client._request("POST", path, json=data)
+        Preferred over ``list()`` when you want everything: a single
+        ``list()`` call returns one page only. ``filters`` are passed to
+        ``list()`` (e.g. ``workspace_token``).
+        """
+        page = 1
+        while True:
+            result = self.list(page=page, limit=limit, **filters)
+            yield from getattr(result, self._items)
+            if not result.links.get("next"):
+                break
+            page += 1
 
-    def _put(self, path: str, data: dict) -> dict:
-        return self._client._request("PUT", path, json=data)
+    def _get(self, model: type[ModelT], path: str, **params) -> ModelT:
+        return self._client._request("GET", path, model, params=params)
 
-    def _delete(self, path: str) -> dict:
-        return self._client._request("DELETE", path)
+    def _post(self, model: type[ModelT], path: str, data: dict) -> ModelT:
+        return self._client._request("POST", path, model, content=orjson.dumps(data))
+
+    def _put(self, model: type[ModelT], path: str, data: dict) -> ModelT:
+        return self._client._request("PUT", path, model, content=orjson.dumps(data))
+
+    def _delete(self, model: type[ModelT], path: str) -> ModelT:
+        return self._client._request("DELETE", path, model)
 
 
 class WorkspacesResource(_Resource):
+    _items = "workspaces"
+
     def list(self, page: int = 1, limit: int = 25) -> WorkspaceList:
-        return WorkspaceList(**self._get("/workspaces", page=page, limit=limit))
+        return self._get(WorkspaceList, "/workspaces", page=page, limit=limit)
 
     def get(self, token: str) -> Workspace:
-        return Workspace(**self._get(f"/workspaces/{token}"))
+        return self._get(Workspace, f"/workspaces/{token}")
 
     def create(self, name: str) -> Workspace:
-        return Workspace(**self._post("/workspaces", {"name": name}))
+        return self._post(Workspace, "/workspaces", {"name": name})
 
     def update(self, token: str, name: str) -> Workspace:
-        return Workspace(**self._put(f"/workspaces/{token}", {"name": name}))
+        return self._put(Workspace, f"/workspaces/{token}", {"name": name})
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/workspaces/{token}"))
+        return self._delete(Message, f"/workspaces/{token}")
 
 
 class CostReportsResource(_Resource):
+    _items = "cost_reports"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> CostReportList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return CostReportList(**self._get("/cost_reports", **params))
+        return self._get(CostReportList, "/cost_reports", **params)
 
     def get(self, token: str) -> CostReport:
-        return CostReport(**self._get(f"/cost_reports/{token}"))
+        return self._get(CostReport, f"/cost_reports/{token}")
 
     def create(self, **kwargs) -> CostReport:
-        return CostReport(**self._post("/cost_reports", kwargs))
+        return self._post(CostReport, "/cost_reports", kwargs)
 
     def update(self, token: str, **kwargs) -> CostReport:
-        return CostReport(**self._put(f"/cost_reports/{token}", kwargs))
+        return self._put(CostReport, f"/cost_reports/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/cost_reports/{token}"))
+        return self._delete(Message, f"/cost_reports/{token}")
 
 
 class FoldersResource(_Resource):
+    _items = "folders"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> FolderList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return FolderList(**self._get("/folders", **params))
+        return self._get(FolderList, "/folders", **params)
 
     def get(self, token: str) -> Folder:
-        return Folder(**self._get(f"/folders/{token}"))
+        return self._get(Folder, f"/folders/{token}")
 
     def create(self, **kwargs) -> Folder:
-        return Folder(**self._post("/folders", kwargs))
+        return self._post(Folder, "/folders", kwargs)
 
     def update(self, token: str, **kwargs) -> Folder:
-        return Folder(**self._put(f"/folders/{token}", kwargs))
+        return self._put(Folder, f"/folders/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/folders/{token}"))
+        return self._delete(Message, f"/folders/{token}")
 
 
 class SavedFiltersResource(_Resource):
+    _items = "saved_filters"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> SavedFilterList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return SavedFilterList(**self._get("/saved_filters", **params))
+        return self._get(SavedFilterList, "/saved_filters", **params)
 
     def get(self, token: str) -> SavedFilter:
-        return SavedFilter(**self._get(f"/saved_filters/{token}"))
+        return self._get(SavedFilter, f"/saved_filters/{token}")
 
     def create(self, **kwargs) -> SavedFilter:
-        return SavedFilter(**self._post("/saved_filters", kwargs))
+        return self._post(SavedFilter, "/saved_filters", kwargs)
 
     def update(self, token: str, **kwargs) -> SavedFilter:
-        return SavedFilter(**self._put(f"/saved_filters/{token}", kwargs))
+        return self._put(SavedFilter, f"/saved_filters/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/saved_filters/{token}"))
+        return self._delete(Message, f"/saved_filters/{token}")
 
 
 class DashboardsResource(_Resource):
+    _items = "dashboards"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> DashboardList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return DashboardList(**self._get("/dashboards", **params))
+        return self._get(DashboardList, "/dashboards", **params)
 
     def get(self, token: str) -> Dashboard:
-        return Dashboard(**self._get(f"/dashboards/{token}"))
+        return self._get(Dashboard, f"/dashboards/{token}")
 
     def create(self, **kwargs) -> Dashboard:
-        return Dashboard(**self._post("/dashboards", kwargs))
+        return self._post(Dashboard, "/dashboards", kwargs)
 
     def update(self, token: str, **kwargs) -> Dashboard:
-        return Dashboard(**self._put(f"/dashboards/{token}", kwargs))
+        return self._put(Dashboard, f"/dashboards/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/dashboards/{token}"))
+        return self._delete(Message, f"/dashboards/{token}")
 
 
 class SegmentsResource(_Resource):
+    _items = "segments"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> SegmentList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return SegmentList(**self._get("/segments", **params))
+        return self._get(SegmentList, "/segments", **params)
 
     def get(self, token: str) -> Segment:
-        return Segment(**self._get(f"/segments/{token}"))
+        return self._get(Segment, f"/segments/{token}")
 
     def create(self, **kwargs) -> Segment:
-        return Segment(**self._post("/segments", kwargs))
+        return self._post(Segment, "/segments", kwargs)
 
     def update(self, token: str, **kwargs) -> Segment:
-        return Segment(**self._put(f"/segments/{token}", kwargs))
+        return self._put(Segment, f"/segments/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/segments/{token}"))
+        return self._delete(Message, f"/segments/{token}")
 
 
 class TeamsResource(_Resource):
+    _items = "teams"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> TeamList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return TeamList(**self._get("/teams", **params))
+        return self._get(TeamList, "/teams", **params)
 
     def get(self, token: str) -> Team:
-        return Team(**self._get(f"/teams/{token}"))
+        return self._get(Team, f"/teams/{token}")
 
     def create(self, **kwargs) -> Team:
-        return Team(**self._post("/teams", kwargs))
+        return self._post(Team, "/teams", kwargs)
 
     def update(self, token: str, **kwargs) -> Team:
-        return Team(**self._put(f"/teams/{token}", kwargs))
+        return self._put(Team, f"/teams/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/teams/{token}"))
+        return self._delete(Message, f"/teams/{token}")
 
 
 class AccessGrantsResource(_Resource):
+    _items = "access_grants"
+
     def list(self, team_token: str | None = None, page: int = 1, limit: int = 25) -> AccessGrantList:
         params = {"page": page, "limit": limit}
         if team_token:
             params["team_token"] = team_token
-        return AccessGrantList(**self._get("/access_grants", **params))
+        return self._get(AccessGrantList, "/access_grants", **params)
 
     def create(self, **kwargs) -> AccessGrant:
-        return AccessGrant(**self._post("/access_grants", kwargs))
+        return self._post(AccessGrant, "/access_grants", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/access_grants/{token}"))
+        return self._delete(Message, f"/access_grants/{token}")
 
 
 class VirtualTagsResource(_Resource):
+    _items = "virtual_tags"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> VirtualTagList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return VirtualTagList(**self._get("/virtual_tags", **params))
+        return self._get(VirtualTagList, "/virtual_tags", **params)
 
     def get(self, token: str) -> VirtualTag:
-        return VirtualTag(**self._get(f"/virtual_tags/{token}"))
+        return self._get(VirtualTag, f"/virtual_tags/{token}")
 
     def create(self, **kwargs) -> VirtualTag:
-        return VirtualTag(**self._post("/virtual_tags", kwargs))
+        return self._post(VirtualTag, "/virtual_tags", kwargs)
 
     def update(self, token: str, **kwargs) -> VirtualTag:
-        return VirtualTag(**self._put(f"/virtual_tags/{token}", kwargs))
+        return self._put(VirtualTag, f"/virtual_tags/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/virtual_tags/{token}"))
+        return self._delete(Message, f"/virtual_tags/{token}")
 
 
 class APITokensResource(_Resource):
+    _items = "api_tokens"
+
     def list(self, page: int = 1, limit: int = 25) -> APITokenList:
-        return APITokenList(**self._get("/api_tokens", page=page, limit=limit))
+        return self._get(APITokenList, "/api_tokens", page=page, limit=limit)
 
     def create(self, name: str, scopes: str = "read") -> APITokenCreated:
-        return APITokenCreated(**self._post("/api_tokens", {"name": name, "scopes": scopes}))
+        return self._post(APITokenCreated, "/api_tokens", {"name": name, "scopes": scopes})
 
     def revoke(self, token_prefix: str) -> Message:
-        return Message(**self._delete(f"/api_tokens/{token_prefix}"))
+        return self._delete(Message, f"/api_tokens/{token_prefix}")
 
 
 class ResourceReportsResource(_Resource):
+    _items = "resource_reports"
+
     def list(self, workspace_token: str | None = None, page: int = 1, limit: int = 25) -> ResourceReportList:
         params = {"page": page, "limit": limit}
         if workspace_token:
             params["workspace_token"] = workspace_token
-        return ResourceReportList(**self._get("/resource_reports", **params))
+        return self._get(ResourceReportList, "/resource_reports", **params)
 
     def get(self, token: str) -> ResourceReport:
-        return ResourceReport(**self._get(f"/resource_reports/{token}"))
+        return self._get(ResourceReport, f"/resource_reports/{token}")
 
     def create(self, **kwargs) -> ResourceReport:
-        return ResourceReport(**self._post("/resource_reports", kwargs))
+        return self._post(ResourceReport, "/resource_reports", kwargs)
 
     def update(self, token: str, **kwargs) -> ResourceReport:
-        return ResourceReport(**self._put(f"/resource_reports/{token}", kwargs))
+        return self._put(ResourceReport, f"/resource_reports/{token}", kwargs)
 
     def delete(self, token: str) -> Message:
-        return Message(**self._delete(f"/resource_reports/{token}"))
+        return self._delete(Message, f"/resource_reports/{token}")
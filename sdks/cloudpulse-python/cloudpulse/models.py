@@ -4,10 +4,21 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class PaginatedLinks(BaseModel):
+class _Base(BaseModel):
+    """
+    Shared config for API response models.
+
+    Responses are read-only snapshots, so instances are frozen and field
+    assignment raises. Unknown fields from newer API versions are ignored.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+
+class PaginatedLinks(_Base):
     self_link: str | None = Field(None, alias="self")
     next: str | None = None
     prev: str | None = None
@@ -15,21 +26,21 @@ class PaginatedLinks(BaseModel):
 
 # --- Workspaces ---
 
-class Workspace(BaseModel):
+class Workspace(_Base):
     token: str
     name: str
     is_default: bool = False
     created_at: datetime
 
 
-class WorkspaceList(BaseModel):
+class WorkspaceList(_Base):
     workspaces: list[Workspace] = []
     links: dict = {}
 
 
 # --- Cost Reports ---
 
-class CostReport(BaseModel):
+class CostReport(_Base):
     token: str
     title: str
     workspace_token: str | None = None
@@ -44,14 +55,14 @@ class CostReport(BaseModel):
     created_at: datetime
 
 
-class CostReportList(BaseModel):
+class CostReportList(_Base):
     cost_reports: list[CostReport] = []
     links: dict = {}
 
 
 # --- Folders ---
 
-class Folder(BaseModel):
+class Folder(_Base):
     token: str
     title: str
     workspace_token: str | None = None
@@ -59,28 +70,28 @@ class Folder(BaseModel):
     created_at: datetime
 
 
-class FolderList(BaseModel):
+class FolderList(_Base):
     folders: list[Folder] = []
     links: dict = {}
 
 
 # --- Saved Filters ---
 
-class SavedFilter(BaseModel):
+class SavedFilter(_Base):
     token: str
     title: str
     filter: str
     created_at: datetime
 
 
-class SavedFilterList(BaseModel):
+class SavedFilterList(_Base):
     saved_filters: list[SavedFilter] = []
     links: dict = {}
 
 
 # --- Dashboards ---
 
-class Dashboard(BaseModel):
+class Dashboard(_Base):
     token: str
     title: str
     widgets: list[dict] = []
@@ -90,14 +101,14 @@ class Dashboard(BaseModel):
     created_at: datetime
 
 
-class DashboardList(BaseModel):
+class DashboardList(_Base):
     dashboards: list[Dashboard] = []
     links: dict = {}
 
 
 # --- Segments ---
 
-class Segment(BaseModel):
+class Segment(_Base):
     token: str
     title: str
     description: str | None = None
@@ -107,28 +118,28 @@ class Segment(BaseModel):
     created_at: datetime
 
 
-class SegmentList(BaseModel):
+class SegmentList(_Base):
     segments: list[Segment] = []
     links: dict = {}
 
 
 # --- Teams ---
 
-class Team(BaseModel):
+class Team(_Base):
     token: str
     name: str
     description: str | None = None
     created_at: datetime
 
 
-class TeamList(BaseModel):
+class TeamList(_Base):
     teams: list[Team] = []
     links: dict = {}
 
 
 # --- Access Grants ---
 
-class AccessGrant(BaseModel):
+class AccessGrant(_Base):
     token: str
     team_token: str | None = None
     resource_type: str
@@ -137,14 +148,14 @@ class AccessGrant(BaseModel):
     created_at: datetime
 
 
-class AccessGrantList(BaseModel):
+class AccessGrantList(_Base):
     access_grants: list[AccessGrant] = []
     links: dict = {}
 
 
 # --- Virtual Tags ---
 
-class VirtualTag(BaseModel):
+class VirtualTag(_Base):
     token: str
     key: str
     description: str | None = None
@@ -154,14 +165,14 @@ class VirtualTag(BaseModel):
     created_at: datetime
 
 
-class VirtualTagList(BaseModel):
+class VirtualTagList(_Base):
     virtual_tags: list[VirtualTag] = []
     links: dict = {}
 
 
 # --- API Tokens ---
 
-class APIToken(BaseModel):
+class APIToken(_Base):
     token_prefix: str
     name: str
     scopes: str
@@ -174,14 +185,14 @@ class APITokenCreated(APIToken):
     token: str
 
 
-class APITokenList(BaseModel):
+class APITokenList(_Base):
     api_tokens: list[APIToken] = []
     links: dict = {}
 
 
 # --- Resource Reports ---
 
-class ResourceReport(BaseModel):
+class ResourceReport(_Base):
     token: str
     title: str
     filter: str | None = None
@@ -190,12 +201,12 @@ class ResourceReport(BaseModel):
     created_at: datetime
 
 
-class ResourceReportList(BaseModel):
+class ResourceReportList(_Base):
     resource_reports: list[ResourceReport] = []
     links: dict = {}
 
 
 # --- Shared ---
 
-class Message(BaseModel):
+class Message(_Base):
     message: str
@@ -4,73 +4,82 @@ CloudPulse Python SDK — Quick Start Example.
 pip install cloudpulse-sdk
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from cloudpulse import CloudPulseClient
 
-# Initialize client with your API token
-client = CloudPulseClient(
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)  # skip per-request lines
+log = logging.getLogger(__name__)
+
+# Initialize client with your API token. Use it as a context manager so
+# every call below reuses one pooled keep-alive connection and the pool is
+# closed at the end.
+with CloudPulseClient(
     api_token=os.environ["CLOUDPULSE_API_TOKEN"],
     base_url=os.environ.get("CLOUDPULSE_API_URL", "https://api.cloudpulse.dev"),
-)
-
-# --- Workspaces ---
-print("=== Workspaces ===")
-workspace = client.workspaces.create(name="Production")
-print(f"Created workspace: {workspace.token}")
-
-workspaces = client.workspaces.list()
-for ws in workspaces.workspaces:
-    print(f"  - {ws.name} ({ws.token})")
+) as client:
+    # --- Workspaces ---
+    log.info("=== Workspaces ===")
+    workspace = client.workspaces.create(name="Production")
+    log.info(f"Created workspace: {workspace.token}")
 
-# --- Cost Reports ---
-print("\n=== Cost Reports ===")
-report = client.cost_reports.create(
-    title="Monthly EC2 Costs",
-    workspace_token=workspace.token,
-    filter='costs.provider = "aws" AND costs.service = "Amazon EC2"',
-    groupings="service",
-    date_interval="last_30_days",
-)
-print(f"Created report: {report.token} — {report.title}")
+    workspaces = client.workspaces.list()
+    for ws in workspaces.workspaces:
+        log.info(f"  - {ws.name} ({ws.token})")
 
-# --- Folders ---
-print("\n=== Folders ===")
-folder = client.folders.create(
-    title="Engineering",
-    workspace_token=workspace.token,
-)
-print(f"Created folder: {folder.token}")
+    # --- Cost Reports ---
+    log.info("\n=== Cost Reports ===")
+    report = client.cost_reports.create(
+        title="Monthly EC2 Costs",
+        workspace_token=workspace.token,
+        filter='costs.provider = "aws" AND costs.service = "Amazon EC2"',
+        groupings="service",
+        date_interval="last_30_days",
+    )
+    log.info(f"Created report: {report.token} — {report.title}")
 
-# --- Segments ---
-print("\n=== Segments ===")
-segment = client.segments.create(
-    title="Backend Services",
-    workspace_token=workspace.token,
-    filter='costs.service = "Amazon EC2" OR costs.service = "Amazon RDS"',
-)
-print(f"Created segment: {segment.token}")
+    # --- Folders ---
+    log.info("\n=== Folders ===")
+    folder = client.folders.create(
+        title="Engineering",
+        workspace_token=workspace.token,
+    )
+    log.info(f"Created folder: {folder.token}")
 
-# --- Virtual Tags ---
-print("\n=== Virtual Tags ===")
-vtag = client.virtual_tags.create(
-    key="team",
-    workspace_token=workspace.token,
-    description="Map costs to engineering teams",
-    values=[
-        {"name": "platform", "filter": 'tags.team = "platform"'},
-        {"name": "frontend", "filter": 'tags.team = "frontend"'},
-    ],
-)
-print(f"Created virtual tag: {vtag.token} ({vtag.key})")
+    # --- Segments ---
+    log.info("\n=== Segments ===")
+    segment = client.segments.create(
+        title="Backend Services",
+        workspace_token=workspace.token,
+        filter='costs.service = "Amazon EC2" OR costs.service = "Amazon RDS"',
+    )
+    log.info(f"Created segment: {segment.token}")
 
-# --- Clean up ---
-print("\n=== Cleanup ===")
-client.virtual_tags.delete(vtag.token)
-client.segments.delete(segment.token)
-client.folders.delete(folder.token)
-client.cost_reports.delete(report.token)
-client.workspaces.delete(workspace.token)
-print("All resources cleaned up.")
+    # --- Virtual Tags ---
+    log.info("\n=== Virtual Tags ===")
+    vtag = client.virtual_tags.create(
+        key="team",
+        workspace_token=workspace.token,
+        description="Map costs to engineering teams",
+        values=[
+            {"name": "platform", "filter": 'tags.team = "platform"'},
+            {"name": "frontend", "filter": 'tags.team = "frontend"'},
+        ],
+    )
+    log.info(f"Created virtual tag: {vtag.token} ({vtag.key})")
 
-client.close()
+    # --- Clean up ---
+    # Deleting a workspace also deletes its cost reports and folders, so
+    # only the virtual tag and segment need their own (concurrent) deletes.
+    log.info("\n=== Cleanup ===")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for future in [
+            pool.submit(client.virtual_tags.delete, vtag.token),
+            pool.submit(client.segments.delete, segment.token),
+        ]:
+            future.result()
+    client.workspaces.delete(workspace.token)
+    log.info("All resources cleaned up.")
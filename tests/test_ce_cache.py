@@ -0,0 +1,150 @@
+"""Tests for the Cost Explorer response cache."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.services import ce_cache as ce_cache_module
+from app.services.ce_cache import (
+    RECENT_TTL_SECONDS,
+    CacheMissError,
+    CostExplorerCache,
+    ce_cache,
+    ttl_for_window,
+)
+
+TODAY = date(2024, 6, 15)
+
+
+@pytest.fixture
+def use_cache(tmp_path, monkeypatch):
+    """Install a fresh on-disk cache as the module singleton."""
+    def install(mode: str = "enabled") -> CostExplorerCache:
+        cache = CostExplorerCache(str(tmp_path / "ce_cache.sqlite"), mode)
+        monkeypatch.setattr(ce_cache_module, "_cache", cache)
+        return cache
+    return install
+
+
+class FakeExplorer:
+    def __init__(self, account_id: str = "111111111111"):
+        self.account_id = account_id
+        self.calls = 0
+
+    @ce_cache()
+    def get_total_cost(self, start_date, end_date, granularity="DAILY"):
+        self.calls += 1
+        return [{"date": start_date.isoformat(), "amount": 1.5}]
+
+
+# --- ttl_for_window ---
+
+def test_settled_window_never_expires():
+    assert ttl_for_window(TODAY - timedelta(days=2), today=TODAY) is None
+    assert ttl_for_window(TODAY - timedelta(days=30), today=TODAY) is None
+
+
+def test_recent_window_gets_ttl():
+    assert ttl_for_window(TODAY - timedelta(days=1), today=TODAY) == RECENT_TTL_SECONDS
+    assert ttl_for_window(TODAY, today=TODAY) == RECENT_TTL_SECONDS
+    assert ttl_for_window(TODAY + timedelta(days=1), today=TODAY) == RECENT_TTL_SECONDS
+
+
+# --- CostExplorerCache ---
+
+def test_entry_expires_after_ttl(tmp_path, monkeypatch):
+    cache = CostExplorerCache(str(tmp_path / "ce_cache.sqlite"))
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_000.0)
+    cache.set("k", {"v": 1}, ttl=60)
+
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_059.0)
+    assert cache.get("k") == (True, {"v": 1})
+
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_061.0)
+    assert cache.get("k") == (False, None)
+
+
+def rows(cache: CostExplorerCache) -> list[str]:
+    return [key for (key,) in cache.conn.execute("SELECT key FROM ce_cache ORDER BY key")]
+
+
+def test_expired_entry_deleted_on_read(tmp_path, monkeypatch):
+    cache = CostExplorerCache(str(tmp_path / "ce_cache.sqlite"))
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_000.0)
+    cache.set("k", 1, ttl=60)
+
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_061.0)
+    assert cache.get("k") == (False, None)
+    assert rows(cache) == []
+
+
+def test_expired_entries_swept_on_open(tmp_path, monkeypatch):
+    path = str(tmp_path / "ce_cache.sqlite")
+    cache = CostExplorerCache(path)
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_000.0)
+    cache.set("recent", 1, ttl=60)
+    cache.set("settled", 2, ttl=None)
+    cache.conn.close()
+
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 1_061.0)
+    assert rows(CostExplorerCache(path)) == ["settled"]
+
+
+def test_entry_without_ttl_never_expires(tmp_path, monkeypatch):
+    cache = CostExplorerCache(str(tmp_path / "ce_cache.sqlite"))
+    cache.set("k", [1, 2], ttl=None)
+
+    monkeypatch.setattr(ce_cache_module.time, "time", lambda: 10**12)
+    assert cache.get("k") == (True, [1, 2])
+
+
+def test_invalid_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CostExplorerCache(str(tmp_path / "ce_cache.sqlite"), "sometimes")
+
+
+# --- @ce_cache ---
+
+def test_enabled_mode_serves_second_call_from_cache(use_cache):
+    use_cache("enabled")
+    explorer = FakeExplorer()
+    start, end = date(2024, 1, 1), date(2024, 2, 1)
+
+    first = explorer.get_total_cost(start, end)
+    assert explorer.get_total_cost(start, end) == first
+    assert explorer.calls == 1
+
+    # Defaulted arguments are part of the key
+    explorer.get_total_cost(start, end, "MONTHLY")
+    assert explorer.calls == 2
+
+
+def test_entries_are_scoped_to_the_account(use_cache):
+    use_cache("enabled")
+    start, end = date(2024, 1, 1), date(2024, 2, 1)
+    FakeExplorer("111111111111").get_total_cost(start, end)
+
+    other = FakeExplorer("222222222222")
+    other.get_total_cost(start, end)
+    assert other.calls == 1
+
+
+def test_replay_mode_raises_on_miss(use_cache):
+    use_cache("replay")
+    explorer = FakeExplorer()
+
+    with pytest.raises(CacheMissError):
+        explorer.get_total_cost(date(2024, 1, 1), date(2024, 2, 1))
+    assert explorer.calls == 0
+
+
+def test_replay_mode_serves_recorded_responses(use_cache):
+    start, end = date(2024, 1, 1), date(2024, 2, 1)
+    use_cache("enabled")
+    recorded = FakeExplorer().get_total_cost(start, end)
+
+    cache = use_cache("replay")
+    cache._conn = None  # reopen the same file as a fresh process would
+    explorer = FakeExplorer()
+    assert explorer.get_total_cost(start, end) == recorded
+    assert explorer.calls == 0
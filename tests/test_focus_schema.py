@@ -0,0 +1,126 @@
+"""Parity between the DuckDB and Python AWS CUR → FOCUS transforms."""
+
+import csv
+import json
+
+import duckdb
+import pytest
+
+from app.services.focus_schema import FOCUS_SCHEMA, aws_cur_focus_sql, normalize_aws_cur
+
+CUR_COLUMNS = [
+    "lineItem/UsageAccountId",
+    "lineItem/ProductCode",
+    "product/region",
+    "lineItem/ResourceId",
+    "lineItem/UsageStartDate",
+    "lineItem/LineItemType",
+    "lineItem/UnblendedCost",
+    "lineItem/CurrencyCode",
+    "resourceTags/user:Team",
+    "resourceTags/user:Owner's",
+]
+
+
+def cur_row(resource_id: str, **overrides: str) -> dict:
+    """A CUR row with sensible values; overrides are keyed by column suffix."""
+    row = {
+        "lineItem/UsageAccountId": "123456789012",
+        "lineItem/ProductCode": "AmazonEC2",
+        "product/region": "us-east-1",
+        "lineItem/ResourceId": resource_id,
+        "lineItem/UsageStartDate": "2024-03-05T00:00:00Z",
+        "lineItem/LineItemType": "Usage",
+        "lineItem/UnblendedCost": "1.25",
+        "lineItem/CurrencyCode": "USD",
+        "resourceTags/user:Team": "",
+        "resourceTags/user:Owner's": "",
+    }
+    for suffix, value in overrides.items():
+        (column,) = [c for c in CUR_COLUMNS if c.endswith("/" + suffix) or c.endswith(":" + suffix)]
+        row[column] = value
+    return row
+
+
+ROWS = [
+    cur_row("plain"),
+    cur_row("mapped-service", ProductCode="AmazonS3"),
+    cur_row("unmapped-service", ProductCode="AmazonBedrock"),
+    cur_row("blank-service", ProductCode=""),
+    cur_row("blank-currency", CurrencyCode=""),
+    cur_row("eur", CurrencyCode="EUR"),
+    cur_row("blank-charge-type", LineItemType=""),
+    cur_row("unknown-charge-type", LineItemType="SomethingNew"),
+    cur_row("credit", LineItemType="Credit", UnblendedCost="-3.5"),
+    cur_row("rounded", UnblendedCost="1.23456789"),
+    cur_row("below-threshold", UnblendedCost="0.00001"),
+    cur_row("blank-cost", UnblendedCost=""),
+    cur_row("bad-cost", UnblendedCost="n/a"),
+    cur_row("no-date", UsageStartDate=""),
+    cur_row("blank-region", region=""),
+    cur_row("tagged", **{"Team": "payments", "Owner's": "o'brien"}),
+    cur_row("partly-tagged", Team="search"),
+    cur_row(""),
+]
+
+
+def comparable(row: dict) -> dict:
+    row = dict(row)
+    row["usage_date"] = str(row["usage_date"])
+    row["amount"] = float(row["amount"])
+    row["tags"] = json.loads(row["tags"]) if row["tags"] is not None else None
+    return row
+
+
+@pytest.fixture
+def cur_csv(tmp_path):
+    path = tmp_path / "cur.csv"
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CUR_COLUMNS)
+        writer.writeheader()
+        writer.writerows(ROWS)
+    return path
+
+
+def test_sql_matches_python_normalizer(cur_csv):
+    with cur_csv.open(newline="") as f:
+        expected = [comparable(r) for r in normalize_aws_cur(list(csv.DictReader(f)))]
+
+    src = str(cur_csv).replace("'", "''")
+    source = f"read_csv_auto('{src}', header=true, all_varchar=true)"
+    conn = duckdb.connect()
+    try:
+        columns = {r[0] for r in conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()}
+        cursor = conn.execute(aws_cur_focus_sql(source, columns))
+        names = [d[0] for d in cursor.description]
+        actual = [comparable(dict(zip(names, r))) for r in cursor.fetchall()]
+    finally:
+        conn.close()
+
+    assert names == FOCUS_SCHEMA.names
+    by_resource = lambda r: r["resource_id"]  # noqa: E731
+    assert sorted(actual, key=by_resource) == sorted(expected, key=by_resource)
+
+
+def test_blank_cells_use_defaults():
+    rows = normalize_aws_cur([
+        cur_row("r", ProductCode="", CurrencyCode="", LineItemType=""),
+    ])
+    assert rows[0]["service"] == "Unknown"
+    assert rows[0]["currency"] == "USD"
+    assert rows[0]["charge_type"] == "Usage"
+
+
+def test_missing_columns_use_same_defaults_as_python():
+    columns = {"lineItem/UsageStartDate", "lineItem/UnblendedCost"}
+    source = "(SELECT '2024-03-05T00:00:00Z' AS \"lineItem/UsageStartDate\", '2' AS \"lineItem/UnblendedCost\")"
+    conn = duckdb.connect()
+    try:
+        cursor = conn.execute(aws_cur_focus_sql(source, columns))
+        names = [d[0] for d in cursor.description]
+        (sql_row,) = [comparable(dict(zip(names, r))) for r in cursor.fetchall()]
+    finally:
+        conn.close()
+
+    (py_row,) = normalize_aws_cur([{c: "2024-03-05T00:00:00Z" if "Date" in c else "2" for c in columns}])
+    assert sql_row == comparable(py_row)
@@ -0,0 +1,132 @@
+"""Tests for Cost Explorer request chunking and rate limiting."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.services import local_cost_explorer
+from app.services.local_cost_explorer import MIN_CHUNK_DAYS, _chunk_date_range, _RateLimiter
+
+
+def assert_contiguous(chunks, start, end):
+    assert chunks[0][0] == start
+    assert chunks[-1][1] == end
+    for (_, prev_end), (next_start, _) in zip(chunks, chunks[1:]):
+        assert prev_end == next_start
+    assert all(a < b for a, b in chunks)
+
+
+# --- _chunk_date_range ---
+
+def test_short_daily_range_is_one_chunk():
+    start = date(2024, 1, 1)
+    for days in (1, MIN_CHUNK_DAYS - 1, MIN_CHUNK_DAYS):
+        end = start + timedelta(days=days)
+        assert _chunk_date_range(start, end) == [(start, end)]
+
+
+def test_daily_range_cut_every_min_chunk_days():
+    start = date(2024, 1, 1)
+    end = start + timedelta(days=2 * MIN_CHUNK_DAYS + 5)
+    assert _chunk_date_range(start, end) == [
+        (start, start + timedelta(days=MIN_CHUNK_DAYS)),
+        (start + timedelta(days=MIN_CHUNK_DAYS), start + timedelta(days=2 * MIN_CHUNK_DAYS)),
+        (start + timedelta(days=2 * MIN_CHUNK_DAYS), end),
+    ]
+
+
+def test_daily_range_on_exact_boundary_has_no_empty_chunk():
+    start = date(2024, 1, 1)
+    end = start + timedelta(days=2 * MIN_CHUNK_DAYS)
+    chunks = _chunk_date_range(start, end)
+    assert len(chunks) == 2
+    assert_contiguous(chunks, start, end)
+
+
+@pytest.mark.parametrize("max_chunks", [1, 3, 8])
+def test_long_daily_range_capped_at_max_chunks(max_chunks):
+    start, end = date(2021, 1, 1), date(2024, 1, 1)
+    chunks = _chunk_date_range(start, end, max_chunks=max_chunks)
+    assert len(chunks) <= max_chunks
+    assert_contiguous(chunks, start, end)
+
+
+def test_monthly_range_cut_on_month_starts():
+    start, end = date(2023, 11, 15), date(2024, 2, 10)
+    assert _chunk_date_range(start, end, "MONTHLY") == [
+        (start, date(2023, 12, 1)),
+        (date(2023, 12, 1), date(2024, 1, 1)),
+        (date(2024, 1, 1), date(2024, 2, 1)),
+        (date(2024, 2, 1), end),
+    ]
+
+
+def test_single_month_is_one_chunk():
+    start, end = date(2024, 3, 1), date(2024, 4, 1)
+    assert _chunk_date_range(start, end, "MONTHLY") == [(start, end)]
+
+
+def test_long_monthly_range_capped_without_splitting_months():
+    start, end = date(2021, 1, 1), date(2024, 1, 1)
+    chunks = _chunk_date_range(start, end, "MONTHLY", max_chunks=8)
+    assert len(chunks) <= 8
+    assert_contiguous(chunks, start, end)
+    assert all(chunk_start.day == 1 for chunk_start, _ in chunks)
+
+
+# --- _RateLimiter ---
+
+class FakeClock:
+    """Stands in for the ``time`` module; sleeping just records the wait."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(local_cost_explorer, "time", fake)
+    return fake
+
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+    limiter = _RateLimiter(rpm=300)  # 5 tokens/s, 5 token burst
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+
+def test_waiting_callers_reserve_successive_tokens(clock):
+    limiter = _RateLimiter(rpm=60)  # 1 token/s, 1 token burst
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    # Each caller waits for its own token rather than racing for the same one
+    assert clock.sleeps == pytest.approx([1.0, 2.0])
+    assert limiter.request_tokens == pytest.approx(-2.0)
+
+
+def test_tokens_refill_over_time_up_to_capacity(clock):
+    limiter = _RateLimiter(rpm=60)
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == pytest.approx([1.0])
+
+    # The reservation is paid back before new tokens accrue
+    clock.now = 2.0
+    limiter.acquire()
+    assert clock.sleeps == pytest.approx([1.0])
+
+    # A long idle period never banks more than one burst
+    clock.now = 100.0
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == pytest.approx([1.0, 1.0])
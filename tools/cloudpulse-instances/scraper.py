@@ -7,16 +7,36 @@ from the AWS Pricing API and generates a static JSON dataset.
 Similar to ec2instances.info (Vantage's most popular open-source project).
 
 Usage:
-    python scraper.py --output data/instances.json
+    python scraper.py --output data/instances.ndjson
+    python scraper.py --pretty --output data/instances.json
     python scraper.py --service ec2 --region us-east-1
+    python scraper.py --no-cache              # always hit the Pricing API
+    python scraper.py --max-age-hours 6       # refetch cached pages older than 6h
+    python scraper.py --bulk                  # stream the regional bulk price list
 """
 
 import argparse
+import csv
+import gzip
+import hashlib
+import io
 import json
 import logging
+import os
+import queue
+import re
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 import boto3
+import orjson
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -34,53 +54,330 @@ REGIONS = [
 ]
 
 
+# Region code -> location name used by the Pricing API
+_REGION_NAMES = {
+    "us-east-1": "US East (N. Virginia)",
+    "us-east-2": "US East (Ohio)",
+    "us-west-1": "US West (N. California)",
+    "us-west-2": "US West (Oregon)",
+    "eu-west-1": "EU (Ireland)",
+    "eu-west-2": "EU (London)",
+    "eu-central-1": "EU (Frankfurt)",
+    "ap-southeast-1": "Asia Pacific (Singapore)",
+    "ap-southeast-2": "Asia Pacific (Sydney)",
+    "ap-northeast-1": "Asia Pacific (Tokyo)",
+}
+
+# Regions are independent and I/O-bound; scrape them concurrently
+MAX_REGION_WORKERS = 10
+
+# Raw get_products pages are cached on disk; pricing changes slowly, so a
+# re-run within the max age skips the API entirely.
+CACHE_DIR = Path(".cache/pricing")
+DEFAULT_CACHE_MAX_AGE_HOURS = 24.0
+
+# get_products items fetched ahead of the parser (~4 pages of 100)
+PREFETCH_ITEMS = 400
+
+
+# One session and keep-alive connection pool for every get_products page,
+# sized to cover all region workers.
+_SESSION = boto3.session.Session()
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+
+
 def get_pricing_client(region: str = "us-east-1"):
     """AWS Pricing API is only available in us-east-1 and ap-south-1."""
-    return boto3.client("pricing", region_name=region)
+    return _SESSION.client("pricing", region_name=region, config=CLIENT_CONFIG)
+
+
+# Region-independent get_products filters for Linux on-demand EC2; only
+# the location filter is added per region.
+_EC2_BASE_FILTERS = (
+    {"Type": "TERM_MATCH", "Field": "servicecode", "Value": "AmazonEC2"},
+    {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
+    {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"},
+    {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
+    {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+)
+
+
+def _prefetch(iterable, depth: int) -> Iterator:
+    """
+    Iterate iterable on a background thread, staying up to depth items
+    ahead of the consumer. For a paginator this issues the next page's
+    request while the caller is still working through the current one.
+    Errors are re-raised in the consumer; abandoning the generator stops
+    the producer.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+            return
+        put((done, None))
+
+    threading.Thread(target=produce, name="pricing-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = q.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _current_price_list_arn(client, service_code: str, region: str) -> str | None:
+    """
+    ARN of the price list in effect now for service_code in region. The ARN
+    embeds the publication version, so it changes whenever prices do.
+    """
+    arn = None
+    for page in client.get_paginator("list_price_lists").paginate(
+        ServiceCode=service_code,
+        EffectiveDate=datetime.now(timezone.utc),
+        CurrencyCode="USD",
+        RegionCode=region,
+    ):
+        for price_list in page.get("PriceLists", []):
+            arn = price_list["PriceListArn"]
+    return arn
+
+
+def _cached_price_items(
+    client,
+    service_code: str,
+    region: str,
+    filters: list[dict],
+    max_age_hours: float | None,
+) -> Iterator[str]:
+    """
+    Yield every get_products PriceList item across all pages, serving from
+    CACHE_DIR when a fresh copy exists. Empty results are cached too.
+    max_age_hours=None bypasses the cache (no reads or writes).
+
+    A copy older than max_age_hours is still served if the region's
+    current price list ARN matches the one recorded when it was fetched,
+    so one ListPriceLists call replaces the whole paginated scrape.
+    """
+    # PageIterator.search flattens PriceList across pages in botocore;
+    # pages are fetched ahead on a thread while items are parsed
+    items = _prefetch(
+        client.get_paginator("get_products").paginate(
+            ServiceCode=service_code, Filters=filters
+        ).search("PriceList"),
+        PREFETCH_ITEMS,
+    )
+
+    if max_age_hours is None:
+        yield from items
+        return
+
+    key = hashlib.blake2b(
+        f"items:{service_code}:{region}:{json.dumps(filters, sort_keys=True)}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    path = CACHE_DIR / f"{key}.json.gz"
+    arn_path = CACHE_DIR / f"{key}.arn"
+
+    arn = None
+    try:
+        fresh = time.time() - path.stat().st_mtime < max_age_hours * 3600
+        if not fresh:
+            try:
+                arn = _current_price_list_arn(client, service_code, region)
+            except Exception as e:
+                logger.warning(f"ListPriceLists failed for {region}, refetching: {e}")
+            fresh = arn is not None and arn_path.read_text() == arn
+            if fresh:
+                logger.info(f"  {region}: price list unchanged ({arn}), using cache")
+                path.touch()
+        if fresh:
+            yield from orjson.loads(gzip.decompress(path.read_bytes()))
+            return
+    except FileNotFoundError:
+        pass
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable pricing cache {path}: {e}")
+
+    if arn is None:
+        try:
+            arn = _current_price_list_arn(client, service_code, region)
+        except Exception as e:
+            logger.warning(f"ListPriceLists failed for {region}: {e}")
+
+    # Items are passed on as they arrive, so parsing overlaps the fetch
+    fetched = []
+    for item in items:
+        fetched.append(item)
+        yield item
+
+    # Only complete fetches are written; write-then-rename keeps a
+    # concurrent reader from seeing a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(gzip.compress(orjson.dumps(fetched)))
+    tmp.replace(path)
+    if arn is not None:
+        arn_path.write_text(arn)
+    else:
+        arn_path.unlink(missing_ok=True)
+
+
+@dataclass(slots=True)
+class Instance:
+    """
+    One instance type's specs and price in a region (one output record).
+
+    Slotted, so tens of thousands of rows stay far smaller than dicts;
+    orjson serializes it natively with fields in this order.
+    """
+
+    instance_type: str
+    family: str
+    vcpu: int
+    memory_gb: float | None
+    storage: str
+    network_performance: str
+    processor: str
+    architecture: str
+    gpu: int
+    on_demand_hourly: float | None
+    on_demand_monthly: float | None
+    region: str
+
+
+def _instance_record(attrs: dict, on_demand: float | None, region: str) -> Instance:
+    """Build an output record from Pricing API product attributes."""
+    instance_type = attrs["instanceType"]
+    return Instance(
+        instance_type=instance_type,
+        family=instance_type.split(".")[0],
+        vcpu=_safe_int(attrs.get("vcpu")),
+        memory_gb=_parse_memory(attrs.get("memory", "")),
+        storage=attrs.get("storage", "EBS only"),
+        network_performance=attrs.get("networkPerformance", ""),
+        processor=attrs.get("physicalProcessor", ""),
+        architecture=attrs.get("processorArchitecture", ""),
+        gpu=_safe_int(attrs.get("gpu", "0")),
+        on_demand_hourly=on_demand,
+        on_demand_monthly=round(on_demand * 730, 2) if on_demand else None,
+        region=region,
+    )
+
+
+# Bulk price-list CSV columns -> get_products attribute names, and the
+# column values matching _EC2_BASE_FILTERS (plus the on-demand term).
+_BULK_CSV_ATTRS = {
+    "Instance Type": "instanceType",
+    "vCPU": "vcpu",
+    "Memory": "memory",
+    "Storage": "storage",
+    "Network Performance": "networkPerformance",
+    "Physical Processor": "physicalProcessor",
+    "Processor Architecture": "processorArchitecture",
+    "GPU": "gpu",
+}
+_BULK_CSV_MATCH = {
+    "TermType": "OnDemand",
+    "Tenancy": "Shared",
+    "Operating System": "Linux",
+    "Pre Installed S/W": "NA",
+    "CapacityStatus": "Used",
+}
+
 
+def fetch_ec2_instances_bulk(client, region: str) -> list[Instance]:
+    """
+    Fetch EC2 instance pricing from the region's bulk price list file.
 
-def fetch_ec2_instances(client, region: str) -> list[dict]:
+    One ListPriceLists + GetPriceListFileUrl pair and a single download
+    replace the paginated get_products calls. The CSV file is streamed
+    row by row, so memory stays flat even though the file is large.
+    """
+    arn = _current_price_list_arn(client, "AmazonEC2", region)
+    if arn is None:
+        raise LookupError(f"No bulk EC2 price list for {region}")
+
+    url = client.get_price_list_file_url(PriceListArn=arn, FileFormat="csv")["Url"]
+
+    instances = []
+    with urllib.request.urlopen(url) as resp:
+        rows = csv.reader(io.TextIOWrapper(resp, encoding="utf-8", newline=""))
+        # Metadata lines (FormatVersion, Disclaimer, ...) precede the header
+        for header in rows:
+            if header and header[0] == "SKU":
+                break
+        else:
+            return instances
+
+        col = {name: i for i, name in enumerate(header)}
+        match = [(col[name], value) for name, value in _BULK_CSV_MATCH.items()]
+        attr_cols = [(col[name], attr) for name, attr in _BULK_CSV_ATTRS.items() if name in col]
+        price_col = col["PricePerUnit"]
+
+        for row in rows:
+            if any(row[i] != value for i, value in match):
+                continue
+            attrs = {attr: row[i] for i, attr in attr_cols if row[i]}
+            instance_type = attrs.get("instanceType", "")
+            if not instance_type or "." not in instance_type:
+                continue
+            price = float(row[price_col]) if row[price_col] else None
+            instances.append(_instance_record(attrs, price, region))
+
+    return instances
+
+
+def fetch_ec2_instances(
+    client,
+    region: str,
+    max_age_hours: float | None = DEFAULT_CACHE_MAX_AGE_HOURS,
+) -> list[Instance]:
     """Fetch EC2 instance types and their pricing."""
     instances = []
-    paginator = client.get_paginator("get_products")
 
     filters = [
-        {"Type": "TERM_MATCH", "Field": "servicecode", "Value": "AmazonEC2"},
+        *_EC2_BASE_FILTERS,
         {"Type": "TERM_MATCH", "Field": "location", "Value": _region_name(region)},
-        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
-        {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"},
-        {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
-        {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
     ]
 
     try:
-        for page in paginator.paginate(ServiceCode="AmazonEC2", Filters=filters):
-            for item in page.get("PriceList", []):
-                data = json.loads(item) if isinstance(item, str) else item
-                product = data.get("product", {})
-                attrs = product.get("attributes", {})
-
-                instance_type = attrs.get("instanceType", "")
-                if not instance_type or "." not in instance_type:
-                    continue
-
-                # Extract On-Demand pricing
-                on_demand = _extract_on_demand_price(data)
-
-                instances.append({
-                    "instance_type": instance_type,
-                    "family": instance_type.split(".")[0],
-                    "vcpu": _safe_int(attrs.get("vcpu")),
-                    "memory_gb": _parse_memory(attrs.get("memory", "")),
-                    "storage": attrs.get("storage", "EBS only"),
-                    "network_performance": attrs.get("networkPerformance", ""),
-                    "processor": attrs.get("physicalProcessor", ""),
-                    "architecture": attrs.get("processorArchitecture", ""),
-                    "gpu": _safe_int(attrs.get("gpu", "0")),
-                    "on_demand_hourly": on_demand,
-                    "on_demand_monthly": round(on_demand * 730, 2) if on_demand else None,
-                    "region": region,
-                })
+        for item in _cached_price_items(client, "AmazonEC2", region, filters, max_age_hours):
+            data = orjson.loads(item) if isinstance(item, str) else item
+            product = data.get("product", {})
+            attrs = product.get("attributes", {})
+
+            instance_type = attrs.get("instanceType", "")
+            if not instance_type or "." not in instance_type:
+                continue
+
+            # Extract On-Demand pricing
+            on_demand = _extract_on_demand_price(data)
+            instances.append(_instance_record(attrs, on_demand, region))
     except Exception as e:
         logger.warning(f"Failed to fetch EC2 pricing for {region}: {e}")
 
@@ -100,43 +397,72 @@ def _extract_on_demand_price(data: dict) -> float | None:
 
 def _region_name(code: str) -> str:
     """Map region code to display name for Pricing API filters."""
-    names = {
-        "us-east-1": "US East (N. Virginia)",
-        "us-east-2": "US East (Ohio)",
-        "us-west-1": "US West (N. California)",
-        "us-west-2": "US West (Oregon)",
-        "eu-west-1": "EU (Ireland)",
-        "eu-west-2": "EU (London)",
-        "eu-central-1": "EU (Frankfurt)",
-        "ap-southeast-1": "Asia Pacific (Singapore)",
-        "ap-southeast-2": "Asia Pacific (Sydney)",
-        "ap-northeast-1": "Asia Pacific (Tokyo)",
-    }
-    return names.get(code, code)
+    return _REGION_NAMES.get(code, code)
+
+
+_MEMORY_RE = re.compile(r"\s*(\d[\d,]*(?:\.\d+)?)\s*(?:GiB)?\s*$")
 
 
 def _parse_memory(mem: str) -> float | None:
-    """Parse '16 GiB' into 16.0."""
-    try:
-        return float(mem.replace("GiB", "").replace(",", "").strip())
-    except (ValueError, AttributeError):
-        return None
+    """Parse '16 GiB' (or '1,952 GiB') into 16.0; None for 'NA' and the like."""
+    m = _MEMORY_RE.match(mem) if isinstance(mem, str) else None
+    return float(m.group(1).replace(",", "")) if m else None
 
 
 def _safe_int(val) -> int:
-    """Safely parse an integer."""
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return 0
+    """Parse a non-negative integer attribute such as vcpu or gpu; 0 if absent or 'NA'."""
+    if isinstance(val, int):
+        return val
+    if isinstance(val, str):
+        val = val.strip()
+        if val.isdecimal():
+            return int(val)
+    return 0
+
+
+def _scrape_region(
+    client,
+    service: str,
+    region: str,
+    max_age_hours: float | None,
+    bulk: bool = False,
+) -> list[Instance]:
+    """Fetch one region's instances for service."""
+    logger.info(f"Fetching {service} instances for {region}...")
+    instances = []
+    if service == "ec2":
+        if bulk:
+            try:
+                instances = fetch_ec2_instances_bulk(client, region)
+            except Exception as e:
+                logger.warning(f"Bulk price list unavailable for {region}, using get_products: {e}")
+                bulk = False
+        if not bulk:
+            instances = fetch_ec2_instances(client, region, max_age_hours)
+        logger.info(f"  Found {len(instances)} instance types in {region}")
+    return instances
 
 
 def main():
     parser = argparse.ArgumentParser(description="CloudPulse Instance Pricing Scraper")
-    parser.add_argument("--output", default="data/instances.json", help="Output JSON file")
+    parser.add_argument("--output", default="data/instances.ndjson", help="Output file")
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Write one indented JSON array instead of newline-delimited JSON",
+    )
     parser.add_argument("--service", default="ec2", choices=SERVICES.keys())
     parser.add_argument("--region", default=None, help="Single region to scrape (default: all)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk page cache")
+    parser.add_argument(
+        "--max-age-hours", type=float, default=DEFAULT_CACHE_MAX_AGE_HOURS,
+        help="Refetch cached pages older than this",
+    )
+    parser.add_argument(
+        "--bulk", action="store_true",
+        help="Stream each region's bulk price list file instead of paginating get_products",
+    )
     args = parser.parse_args()
+    max_age_hours = None if args.no_cache else args.max_age_hours
 
     logging.basicConfig(level=logging.INFO)
     client = get_pricing_client()
@@ -144,25 +470,28 @@ def main():
     regions = [args.region] if args.region else REGIONS
     all_instances = []
 
-    for region in regions:
-        logger.info(f"Fetching {args.service} instances for {region}...")
-        if args.service == "ec2":
-            instances = fetch_ec2_instances(client, region)
+    # boto3 clients are thread-safe, so workers share one. map() keeps
+    # results in region order, so the output file is stable across runs.
+    with ThreadPoolExecutor(max_workers=min(MAX_REGION_WORKERS, len(regions))) as pool:
+        for instances in pool.map(lambda r: _scrape_region(client, args.service, r, max_age_hours, args.bulk), regions):
             all_instances.extend(instances)
-            logger.info(f"  Found {len(instances)} instance types")
 
-    # Deduplicate by (instance_type, region)
-    seen = set()
-    unique = []
+    # Deduplicate by (instance_type, region), keeping the first occurrence
+    by_key: dict[tuple[str, str], Instance] = {}
     for inst in all_instances:
-        key = (inst["instance_type"], inst["region"])
-        if key not in seen:
-            seen.add(key)
-            unique.append(inst)
+        by_key.setdefault((inst.instance_type, inst.region), inst)
+    unique = list(by_key.values())
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(unique, indent=2))
+    with output_path.open("wb") as f:
+        if args.pretty:
+            f.write(orjson.dumps(unique, option=orjson.OPT_INDENT_2))
+        else:
+            # One record per line, written as it's serialized
+            for inst in unique:
+                f.write(orjson.dumps(inst))
+                f.write(b"\n")
     logger.info(f"Wrote {len(unique)} instances to {output_path}")
 
 
@@ -11,72 +11,91 @@ Requirements:
     pip install cloudpulse-sdk
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from cloudpulse import CloudPulseClient
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)  # skip per-request lines
+log = logging.getLogger(__name__)
+
 # --- Configuration ---
 API_TOKEN = os.environ["CLOUDPULSE_API_TOKEN"]
 MONTHLY_BUDGET = 50_000  # $50k/month
 ALERT_THRESHOLD = 0.80   # Alert at 80%
+TEAMS = ["engineering", "data", "platform"]
 
-client = CloudPulseClient(api_token=API_TOKEN)
 
-
-def setup_workspace():
+def setup_workspace(client: CloudPulseClient):
     """Create workspace with team-based cost allocation."""
     # Create workspace
     ws = client.workspaces.create(name="FinOps Automation")
-    print(f"Workspace: {ws.token}")
-
-    # Set up virtual tags for team allocation
-    client.virtual_tags.create(
-        key="cost_center",
-        workspace_token=ws.token,
-        description="Map AWS costs to cost centers",
-        values=[
-            {"name": "engineering", "filter": 'tags.team = "engineering" OR tags.department = "eng"'},
-            {"name": "data", "filter": 'tags.team = "data" OR costs.service = "Amazon Redshift"'},
-            {"name": "platform", "filter": 'tags.team = "platform" OR costs.service = "Amazon EKS"'},
-        ],
-    )
-
-    # Create segments for each team
-    for team in ["engineering", "data", "platform"]:
-        client.segments.create(
-            title=f"{team.title()} Costs",
+    log.info(f"Workspace: {ws.token}")
+
+    # Everything else only needs the workspace token, so create it all
+    # concurrently; the client is thread-safe and shares its keep-alive pool.
+    with ThreadPoolExecutor(max_workers=len(TEAMS) + 2) as pool:
+        # Set up virtual tags for team allocation
+        futures = [pool.submit(
+            client.virtual_tags.create,
+            key="cost_center",
+            workspace_token=ws.token,
+            description="Map AWS costs to cost centers",
+            values=[
+                {"name": "engineering", "filter": 'tags.team = "engineering" OR tags.department = "eng"'},
+                {"name": "data", "filter": 'tags.team = "data" OR costs.service = "Amazon Redshift"'},
+                {"name": "platform", "filter": 'tags.team = "platform" OR costs.service = "Amazon EKS"'},
+            ],
+        )]
+
+        # Create segments for each team
+        futures += [
+            pool.submit(
+                client.segments.create,
+                title=f"{team.title()} Costs",
+                workspace_token=ws.token,
+                filter=f'virtual_tags.cost_center = "{team}"',
+                priority=1,
+            )
+            for team in TEAMS
+        ]
+
+        # Create cost report with daily granularity
+        report_future = pool.submit(
+            client.cost_reports.create,
+            title="Daily Cost Tracker",
             workspace_token=ws.token,
-            filter=f'virtual_tags.cost_center = "{team}"',
-            priority=1,
+            groupings="service",
+            date_interval="this_month",
+            date_bucket="day",
         )
 
-    # Create cost report with daily granularity
-    report = client.cost_reports.create(
-        title="Daily Cost Tracker",
-        workspace_token=ws.token,
-        groupings="service",
-        date_interval="this_month",
-        date_bucket="day",
-    )
+        for future in futures:
+            future.result()  # re-raise any API error
+        report = report_future.result()
 
-    print(f"Report: {report.token}")
+    log.info(f"Report: {report.token}")
     return ws
 
 
-def check_budget_threshold():
+def check_budget_threshold(client: CloudPulseClient):
     """Check if current month spend exceeds threshold."""
     reports = client.cost_reports.list()
     for report in reports.cost_reports:
         if report.title == "Daily Cost Tracker":
             # In production, you'd query the cost data from the report
             # and compare against the budget threshold
-            print(f"Checking report: {report.token}")
-            print(f"Budget: ${MONTHLY_BUDGET:,}")
-            print(f"Alert threshold: {ALERT_THRESHOLD:.0%} (${MONTHLY_BUDGET * ALERT_THRESHOLD:,.0f})")
+            log.info(f"Checking report: {report.token}")
+            log.info(f"Budget: ${MONTHLY_BUDGET:,}")
+            log.info(f"Alert threshold: {ALERT_THRESHOLD:.0%} (${MONTHLY_BUDGET * ALERT_THRESHOLD:,.0f})")
             break
 
 
 if __name__ == "__main__":
-    ws = setup_workspace()
-    check_budget_threshold()
-    print("\nFinOps automation setup complete!")
-    client.close()
+    # One client (and keep-alive connection pool) for the whole run
+    with CloudPulseClient(api_token=API_TOKEN) as client:
+        ws = setup_workspace(client)
+        check_budget_threshold(client)
+    log.info("\nFinOps automation setup complete!")